@@ -18,17 +18,17 @@ import sys
 # ---------------------------------------------------------------------
 # Import path setup
 # ---------------------------------------------------------------------
-# Ensure the project root is on sys.path so module imports work when
-# running this file directly (python applications/MainApplication.py).
-CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
-ROOT_DIR = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
-sys.path.append(ROOT_DIR)
+# Preferred: run `python -m applications.MainApplication` from the project root.
+# Only when this file is run directly (python applications/MainApplication.py)
+# is the project root added to sys.path, so normal imports pay nothing.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # ---------------------------------------------------------------------
 # Choose a scheduler (students: plug yours here)
 # ---------------------------------------------------------------------
 from scheduler.rule_scheduler import RuleBasedScheduler
-from scheduler.ppo_me_scheduler import PpoMEScheduler
+from scheduler.ppo_me_scheduler import PpoMEScheduler  # needs torch: pip install -e ".[ppo]"
 # from scheduler.dqn_scheduler import DQNBasedScheduler  # example: if/when available
 
 from core.simulator import Simulator
@@ -73,6 +73,14 @@ SERVER_CONFIG = {
     },
 }
 
+# LAYER_NAMES / LAYER_IDX
+# -----------------------
+# Fixed tier order used wherever a tier is stored as a small integer
+# (Edge=0, Regional=1, Cloud=2), e.g. Server.tier_idx (copied into TaskBatch.layer_idx)
+# and config/metrics_vec.py.
+LAYER_NAMES = ("Edge", "Regional", "Cloud")
+LAYER_IDX = {name: i for i, name in enumerate(LAYER_NAMES)}
+
 # WORKLOAD
 # --------
 # Controls the synthetic device count ramp and per-device data size.
@@ -83,6 +91,7 @@ WORKLOAD = {
     "increment": 10,
     "data_per_device_kb": 10,  # NOTE: Many metrics scale with this central knob.
     "profile": "default",
+    "use_uuid": False,  # True: Task.id is a uuid4 string; False: a cheap running integer
 }
 
 # SIMULATION
@@ -92,7 +101,8 @@ SIMULATION = {
     "rounds": 1,
     "print_cost": True,
     "print_congestion": True,
-    "log_assignments": True,
+    "log_assignments": True,  # print each report row to the console
+    "binary_sink": None,      # e.g. "results/task_metrics_log.bin" to write packed rows instead of CSV
 }
 
 # MOBILITY_CONFIG
@@ -115,6 +125,7 @@ MOBILITY_CONFIG = {
     },
     "speed_range": (1.0, 5.0),       # meters/sec
     "pause_time": (0.0, 2.0),        # sec between moves
+    "vectorized": False,             # NumPy best-server search for all devices at once (needs NumPy)
 }
 
 # Extension notes for students:
@@ -0,0 +1,41 @@
+"""
+RegionalEdgeSimPy — Educational Release
+
+Author: Dr. Afzal Badshah
+Department of Software Engineering, University of Sargodha
+Website: https://afzalbadshah.com/index.php/afzal-badshah/
+LinkedIn: https://www.linkedin.com/in/afzal-badshah-phd-305b03164/
+Discussion Forum: https://www.resp.afzalbadshah.com
+
+Notes:
+- SERVER_CONFIG flattened into typed NumPy tables, built once at import.
+- Index every table with a tier index from LAYER_IDX (Edge=0, Regional=1, Cloud=2),
+  either a single int or an array of them.
+- Optional: needs NumPy. Edit values in config/config.py, not here.
+"""
+
+import numpy as np
+
+from config.config import SERVER_CONFIG, LAYER_NAMES, LAYER_IDX  # re-exported for table users
+
+
+def _column(key):
+    return np.array([SERVER_CONFIG[l][key] for l in LAYER_NAMES], dtype=np.float64)
+
+
+CPU_CAP     = _column("cpu")
+MEMORY_CAP  = _column("memory")
+STORAGE_CAP = _column("storage")
+BW          = _column("bandwidth")
+DIST        = _column("distance")
+LATENCY     = _column("latency")
+COST        = _column("cost")
+TX_COST     = _column("tx_cost")
+
+INV_BW      = 1.0 / BW  # reciprocal bandwidth: per-task delays multiply instead of divide
+
+# Tiers have different server counts, so positions stay one (n_servers, 2)
+# array per tier rather than a single rectangular table.
+POSITIONS = tuple(
+    np.array(SERVER_CONFIG[l]["positions"], dtype=np.float64) for l in LAYER_NAMES
+)
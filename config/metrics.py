@@ -9,10 +9,13 @@ Discussion Forum: https://www.resp.afzalbadshah.com
 
 Notes:
 - Functionality preserved; comments kept simple for student readability.
+- Helpers return unrounded floats; round only when building a report row
+  (the Reporter's format strings handle console precision). This changes
+  reported Tx_Cost compared with older versions, which rounded every task's
+  cost before summing (see the README's results note).
 """
 
 import math
-import statistics
 from config.config import SERVER_CONFIG, WORKLOAD  # WORKLOAD kept for callers that rely on this import side-effect.
 
 # ------------------------------------------------------------------
@@ -24,7 +27,7 @@ def extract_base_layer(layer_name):
     Turn labels like 'Edge_1' into 'Edge' so we can read SERVER_CONFIG.
     If there is no underscore, return the name as-is.
     """
-    return layer_name.split("_")[0] if "_" in layer_name else layer_name
+    return layer_name.partition("_")[0]
 
 
 # ------------------------------------------------------------------
@@ -36,7 +39,7 @@ def calculate_transmission_cost(data_kb, tx_rate):
     Cost = data (KB) * rate (per KB)
     """
     cost = data_kb * tx_rate
-    return round(cost, 4)
+    return cost
 
 
 def calculate_processing_cost(cpu_demand, processing_rate):
@@ -44,46 +47,59 @@ def calculate_processing_cost(cpu_demand, processing_rate):
     Processing cost = cpu_demand * processing_rate
     """
     cost = cpu_demand * processing_rate
-    return round(cost, 6)
+    return cost
 
 
 def calculate_total_cost(data_kb, cpu_demand, tx_rate, proc_rate):
     """
     Total cost = transmission cost + processing cost
+               = data_kb * tx_rate + cpu_demand * proc_rate   (inlined)
     """
-    tx_cost = calculate_transmission_cost(data_kb, tx_rate)
-    proc_cost = calculate_processing_cost(cpu_demand, proc_rate)
-    total = tx_cost + proc_cost
-    return round(total, 4)
+    return data_kb * tx_rate + cpu_demand * proc_rate
 
 
 # ------------------------------------------------------------------
 # Delay Metrics
 # ------------------------------------------------------------------
 
+# 1 / bandwidth_kbps per tier, so per-task delays multiply instead of divide.
+# Built once from SERVER_CONFIG; full labels ('Edge_1') are added lazily.
+_INV_BW = {tier: 1.0 / spec["bandwidth"] for tier, spec in SERVER_CONFIG.items()}
+
+
 def calculate_transmission_delay(data_kb, layer_name):
     """
     Transmission delay in milliseconds.
     Formula:
       seconds = (data_kb * 8) / bandwidth_kbps
       ms      = seconds * 1000
+            = data_kb * 8000 * (1 / bandwidth_kbps)
     """
-    base = extract_base_layer(layer_name)
-    bandwidth_kbps = SERVER_CONFIG[base]["bandwidth"]
-    seconds = (data_kb * 8) / bandwidth_kbps
-    ms = seconds * 1000
-    return ms
+    inv_bw = _INV_BW.get(layer_name)
+    if inv_bw is None:
+        inv_bw = _INV_BW[layer_name] = _INV_BW[extract_base_layer(layer_name)]
+    return data_kb * 8000.0 * inv_bw
+
+
+PROPAGATION_SPEED_MPS = 2 * 10**8  # meters/second
+
+# Propagation delay only depends on the tier's fixed distance, so it is
+# computed once per tier here. Full labels ('Edge_1') are added lazily.
+_PROP_MS = {
+    tier: (spec["distance"] / PROPAGATION_SPEED_MPS) * 1000
+    for tier, spec in SERVER_CONFIG.items()
+}
 
 
 def calculate_propagation_delay(layer_name):
     """
-    One-way propagation delay in milliseconds using a fixed speed.
+    One-way propagation delay in milliseconds using a fixed speed:
+      ms = (distance_m / 2e8) * 1000   (precomputed per tier)
     """
-    base = extract_base_layer(layer_name)
-    distance_m = SERVER_CONFIG[base]["distance"]
-    propagation_speed_mps = 2 * 10**8  # meters/second
-    ms = (distance_m / propagation_speed_mps) * 1000
-    return round(ms, 4)
+    ms = _PROP_MS.get(layer_name)
+    if ms is None:
+        ms = _PROP_MS[layer_name] = _PROP_MS[extract_base_layer(layer_name)]
+    return ms
 
 
 def calculate_total_delay(data_kb, layer_name):
@@ -93,13 +109,28 @@ def calculate_total_delay(data_kb, layer_name):
     tx_delay = calculate_transmission_delay(data_kb, layer_name)
     prop_delay = calculate_propagation_delay(layer_name)
     total = tx_delay + prop_delay
-    return round(total, 4)
+    return total
 
 
 # ------------------------------------------------------------------
 # Energy Metrics
 # ------------------------------------------------------------------
 
+# Per-tier (base_energy_rate, minor_distance_rate) used by the energy model.
+# Kept in one place so the scalar helpers and config/metrics_vec.py agree.
+ENERGY_RATES = {
+    "Edge":     (0.0000015, 0.000000001),
+    "Regional": (0.000003,  0.000000001),
+    "Cloud":    (0.000005,  0.000000001),
+}
+
+# Fused energy_per_kb = base + distance * minor, folded once per tier at import.
+ENERGY_PER_KB = {
+    tier: base + SERVER_CONFIG[tier]["distance"] * minor
+    for tier, (base, minor) in ENERGY_RATES.items()
+}
+
+
 def calculate_energy_consumption(data_kb, base_energy_rate, distance_m, minor_distance_rate):
     """
     Simple energy model:
@@ -108,22 +139,19 @@ def calculate_energy_consumption(data_kb, base_energy_rate, distance_m, minor_di
     """
     energy_per_kb = base_energy_rate + (distance_m * minor_distance_rate)
     total = data_kb * energy_per_kb
-    return round(total, 6)
+    return total
 
 
 def calculate_edge_energy(data_kb):
-    distance = SERVER_CONFIG["Edge"]["distance"]
-    return calculate_energy_consumption(data_kb, 0.0000015, distance, 0.000000001)
+    return data_kb * ENERGY_PER_KB["Edge"]
 
 
 def calculate_regional_energy(data_kb):
-    distance = SERVER_CONFIG["Regional"]["distance"]
-    return calculate_energy_consumption(data_kb, 0.000003, distance, 0.000000001)
+    return data_kb * ENERGY_PER_KB["Regional"]
 
 
 def calculate_cloud_energy(data_kb):
-    distance = SERVER_CONFIG["Cloud"]["distance"]
-    return calculate_energy_consumption(data_kb, 0.000005, distance, 0.000000001)
+    return data_kb * ENERGY_PER_KB["Cloud"]
 
 
 # ------------------------------------------------------------------
@@ -135,7 +163,7 @@ def calculate_response_time(latency, processing_time):
     Response time (ms) = latency + processing_time
     """
     total = latency + processing_time
-    return round(total, 2)
+    return total
 
 
 def calculate_bandwidth_utilization(used_bandwidth_kb, total_bandwidth_kb):
@@ -145,7 +173,7 @@ def calculate_bandwidth_utilization(used_bandwidth_kb, total_bandwidth_kb):
     if not total_bandwidth_kb:
         return 0.0
     value = (used_bandwidth_kb / total_bandwidth_kb) * 100
-    return round(value, 2)
+    return value
 
 
 def calculate_task_failure_rate(total_tasks, failed_tasks):
@@ -155,35 +183,42 @@ def calculate_task_failure_rate(total_tasks, failed_tasks):
     if not total_tasks:
         return 0.0
     value = (failed_tasks / total_tasks) * 100
-    return round(value, 2)
+    return value
 
 
 # ------------------------------------------------------------------
 # Resource Utilization
 # ------------------------------------------------------------------
 
-def calculate_cpu_utilization(available_cpu, total_cpu):
+def calculate_cpu_utilization(available_cpu, total_cpu, inv_total=None):
     """
-    CPU utilization (%) from available vs total.
+    CPU utilization (%) from available vs total: used / total * 100.
+    Pass inv_total = 1 / total_cpu (e.g. Server.inv_cpu) to skip the division.
     """
-    value = 100 * (1 - available_cpu / total_cpu)
-    return round(value, 2)
+    if inv_total is None:
+        inv_total = 1.0 / total_cpu
+    value = (total_cpu - available_cpu) * inv_total * 100.0
+    return value
 
 
-def calculate_memory_utilization(available_memory, total_memory):
+def calculate_memory_utilization(available_memory, total_memory, inv_total=None):
     """
-    Memory utilization (%).
+    Memory utilization (%). inv_total as in calculate_cpu_utilization.
     """
-    value = 100 * (1 - available_memory / total_memory)
-    return round(value, 2)
+    if inv_total is None:
+        inv_total = 1.0 / total_memory
+    value = (total_memory - available_memory) * inv_total * 100.0
+    return value
 
 
-def calculate_storage_utilization(available_storage, total_storage):
+def calculate_storage_utilization(available_storage, total_storage, inv_total=None):
     """
-    Storage utilization (%).
+    Storage utilization (%). inv_total as in calculate_cpu_utilization.
     """
-    value = 100 * (1 - available_storage / total_storage)
-    return round(value, 2)
+    if inv_total is None:
+        inv_total = 1.0 / total_storage
+    value = (total_storage - available_storage) * inv_total * 100.0
+    return value
 
 
 def calculate_congestion(total_data_kb, bandwidth_kbps):
@@ -191,21 +226,21 @@ def calculate_congestion(total_data_kb, bandwidth_kbps):
     Simple congestion proxy (%).
     """
     value = (total_data_kb / bandwidth_kbps) * 100
-    return round(value, 2)
+    return value
 
 
 # ------------------------------------------------------------------
 # Mobility Metrics (aggregated by the simulator/mobility manager)
 # ------------------------------------------------------------------
+# `metrics` is a MobilityMetrics (mobility/manager.py); derived values are
+# kept up to date as events are recorded, so these are attribute reads.
 
 def calculate_handover_count(metrics):
     return metrics.total_handovers
 
 
 def calculate_handover_success_ratio(metrics):
-    if metrics.handover_attempts == 0:
-        return 0.0
-    return metrics.total_handovers / metrics.handover_attempts
+    return metrics.handover_success_ratio
 
 
 def calculate_extra_handover_delay(metrics):
@@ -215,16 +250,21 @@ def calculate_extra_handover_delay(metrics):
 def calculate_task_delay_increase(baseline_delays, ho_task_delays):
     """
     Mean(ho - base) across paired delays.
+    Uses math.fsum over a generator: no temporary list and none of
+    statistics.mean's per-call type checks.
     """
-    diffs = [ho - base for ho, base in zip(ho_task_delays, baseline_delays)]
-    return statistics.mean(diffs) if diffs else 0.0
+    n = min(len(baseline_delays), len(ho_task_delays))
+    if not n:
+        return 0.0
+    return math.fsum(ho - base for ho, base in zip(ho_task_delays, baseline_delays)) / n
 
 
 def calculate_avg_rss(metrics):
     """
-    Average RSS; returns -inf if no samples.
+    Average RSS of the devices' placed tasks; returns -inf if no samples.
+    O(1): uses the running sum/count the simulator feeds via add_rss().
     """
-    return sum(metrics.rss_samples) / len(metrics.rss_samples) if metrics.rss_samples else -math.inf
+    return metrics.rss_sum / metrics.rss_count if metrics.rss_count else -math.inf
 
 
 def calculate_coverage_outage_time(metrics):
@@ -232,12 +272,8 @@ def calculate_coverage_outage_time(metrics):
 
 
 def calculate_task_drop_rate(metrics):
-    if metrics.total_tasks == 0:
-        return 0.0
-    return metrics.dropped_tasks / metrics.total_tasks
+    return metrics.task_drop_rate
 
 
 def calculate_throughput_variation(metrics):
-    if not metrics.throughputs:
-        return 0.0
-    return max(metrics.throughputs) - min(metrics.throughputs)
+    return metrics.throughput_range
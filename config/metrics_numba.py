@@ -0,0 +1,86 @@
+"""
+RegionalEdgeSimPy — Educational Release
+
+Author: Dr. Afzal Badshah
+Department of Software Engineering, University of Sargodha
+Website: https://afzalbadshah.com/index.php/afzal-badshah/
+LinkedIn: https://www.linkedin.com/in/afzal-badshah-phd-305b03164/
+Discussion Forum: https://www.resp.afzalbadshah.com
+
+Notes:
+- One-pass, per-tier reduction of a round's task metrics.
+- Compiled with Numba when it is installed; otherwise the very same
+  function runs as plain Python, so nothing breaks without Numba.
+- Needs NumPy (like config/metrics_vec.py); the core simulator does not.
+"""
+
+import numpy as np
+
+from config.config_tables import INV_BW, COST, TX_COST
+from config.metrics_vec import ENERGY_VEC, PROP_MS_VEC
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit: return the function unchanged.
+        """
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def aggregate_round(data_kb, layer_idx, cpu_demand, inv_bw, prop_ms, cost, tx_cost, energy_per_kb):
+    """
+    Loop over the round's tasks once and sum, per tier:
+      tx_delay (ms), prop_delay (ms), tx_cost, proc_cost, energy, task count
+
+    data_kb, cpu_demand      : float arrays, one entry per task
+    layer_idx                : int array, tier index per task (Edge=0, Regional=1, Cloud=2);
+                               -1 (unassigned, see TaskBatch) rows are skipped
+    inv_bw ... energy_per_kb : per-tier tables (config/config_tables.py, config/metrics_vec.py)
+
+    Returns a tuple of six arrays, each of length n_tiers.
+    """
+    n_layers = inv_bw.shape[0]
+    tx_delay = np.zeros(n_layers)
+    prop_delay = np.zeros(n_layers)
+    tx_cost_sum = np.zeros(n_layers)
+    proc_cost = np.zeros(n_layers)
+    energy = np.zeros(n_layers)
+    count = np.zeros(n_layers)
+
+    for i in range(data_kb.shape[0]):
+        k = layer_idx[i]
+        if k < 0:
+            continue  # unassigned task: no tier (-1 would index the Cloud row)
+        kb = data_kb[i]
+        tx_delay[k] += kb * 8000.0 * inv_bw[k]
+        prop_delay[k] += prop_ms[k]
+        tx_cost_sum[k] += kb * tx_cost[k]
+        proc_cost[k] += cpu_demand[i] * cost[k]
+        energy[k] += kb * energy_per_kb[k]
+        count[k] += 1.0
+
+    return tx_delay, prop_delay, tx_cost_sum, proc_cost, energy, count
+
+
+def aggregate(data_kb, layer_idx, cpu_demand):
+    """
+    aggregate_round() with the tier tables taken from SERVER_CONFIG.
+    """
+    return aggregate_round(
+        np.asarray(data_kb, dtype=np.float64),
+        np.asarray(layer_idx, dtype=np.int64),
+        np.asarray(cpu_demand, dtype=np.float64),
+        INV_BW,
+        PROP_MS_VEC,
+        COST,
+        TX_COST,
+        ENERGY_VEC,
+    )
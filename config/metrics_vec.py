@@ -0,0 +1,111 @@
+"""
+RegionalEdgeSimPy — Educational Release
+
+Author: Dr. Afzal Badshah
+Department of Software Engineering, University of Sargodha
+Website: https://afzalbadshah.com/index.php/afzal-badshah/
+LinkedIn: https://www.linkedin.com/in/afzal-badshah-phd-305b03164/
+Discussion Forum: https://www.resp.afzalbadshah.com
+
+Notes:
+- Batch (NumPy) versions of the per-task helpers in config/metrics.py.
+- Optional: needs NumPy (installed with the plotting/PPO requirements).
+  The core simulator does its per-server sums in plain Python and stays stdlib-only.
+- Tiers are encoded as small integers: Edge=0, Regional=1, Cloud=2;
+  layer_idx may be a single int or an array of them. -1 (unassigned, see
+  TaskBatch) gives 0.0 for every metric.
+- Nothing is rounded here; round only when building a report row.
+"""
+
+import numpy as np
+
+from config.config_tables import LAYER_NAMES, LAYER_IDX, INV_BW, DIST, COST, TX_COST
+from config.metrics import ENERGY_PER_KB, PROPAGATION_SPEED_MPS
+
+# Energy per KB and propagation delay (ms) by tier index; both are constant
+# per tier. The other tables live in config/config_tables.py.
+ENERGY_VEC = np.array([ENERGY_PER_KB[l] for l in LAYER_NAMES], dtype=np.float64)
+PROP_MS_VEC = DIST / PROPAGATION_SPEED_MPS * 1000.0
+
+
+def layer_index(layer_names):
+    """
+    Encode labels like ['Edge_1', 'Cloud_1'] as an int8 array [0, 2].
+    """
+    return np.fromiter(
+        (LAYER_IDX[name.partition("_")[0]] for name in layer_names),
+        dtype=np.int8,
+        count=len(layer_names),
+    )
+
+
+def _per_tier(table, layer_idx_arr):
+    """
+    table[layer_idx] per task, 0.0 where layer_idx < 0 (unassigned).
+    Masked before indexing: a plain table[-1] would read the Cloud row.
+    """
+    idx = np.asarray(layer_idx_arr)
+    assigned = idx >= 0
+    return np.where(assigned, table[np.where(assigned, idx, 0)], 0.0)[()]
+
+
+# ------------------------------------------------------------------
+# Delay Metrics
+# ------------------------------------------------------------------
+
+def batch_transmission_delay(data_kb_arr, layer_idx_arr):
+    """
+    Transmission delay (ms) per task: (data_kb * 8 * 1000) / bandwidth_kbps
+    """
+    return np.asarray(data_kb_arr, dtype=np.float64) * 8000.0 * _per_tier(INV_BW, layer_idx_arr)
+
+
+def batch_propagation_delay(layer_idx_arr):
+    """
+    One-way propagation delay (ms) per task.
+    """
+    return _per_tier(PROP_MS_VEC, layer_idx_arr)
+
+
+def batch_total_delay(data_kb_arr, layer_idx_arr):
+    """
+    Total delay (ms) = transmission + propagation
+    """
+    return batch_transmission_delay(data_kb_arr, layer_idx_arr) + batch_propagation_delay(layer_idx_arr)
+
+
+# ------------------------------------------------------------------
+# Cost Metrics
+# ------------------------------------------------------------------
+
+def batch_transmission_cost(data_kb_arr, layer_idx_arr):
+    """
+    Transmission cost per task = data (KB) * tier tx_cost
+    """
+    return np.asarray(data_kb_arr, dtype=np.float64) * _per_tier(TX_COST, layer_idx_arr)
+
+
+def batch_processing_cost(cpu_demand_arr, layer_idx_arr):
+    """
+    Processing cost per task = cpu_demand * tier cost
+    """
+    return np.asarray(cpu_demand_arr, dtype=np.float64) * _per_tier(COST, layer_idx_arr)
+
+
+def batch_total_cost(data_kb_arr, cpu_demand_arr, layer_idx_arr):
+    """
+    Total cost per task = data_kb * tier tx_cost + cpu_demand * tier cost
+    """
+    return (np.asarray(data_kb_arr, dtype=np.float64) * _per_tier(TX_COST, layer_idx_arr)
+            + np.asarray(cpu_demand_arr, dtype=np.float64) * _per_tier(COST, layer_idx_arr))
+
+
+# ------------------------------------------------------------------
+# Energy Metrics
+# ------------------------------------------------------------------
+
+def batch_energy(data_kb_arr, layer_idx_arr):
+    """
+    Energy per task = data_kb * energy_per_kb (folded per tier in config/metrics.py)
+    """
+    return np.asarray(data_kb_arr, dtype=np.float64) * _per_tier(ENERGY_VEC, layer_idx_arr)
@@ -9,11 +9,113 @@ Discussion Forum: resp.afzalbadshah.com
 
 Notes:
 - Functionality preserved; comments kept simple for student readability.
-- This module prints metrics to the console and writes them to a CSV file.
+- This module prints metrics to the console and writes them to a CSV file
+  (or, optionally, to a packed binary file; see bin_to_csv()).
 - Students can add/remove/change metrics by modifying TASK_FIELDS below.
 """
 
+import atexit
 import csv
+import os
+import struct
+import sys
+
+from config.config import SIMULATION
+
+
+def _fmt_spec(fmt):
+    """
+    Return the spec of a plain '{:<spec>}' format string ('.2f' for '{:.2f}'),
+    or None if fmt is anything more elaborate.
+    """
+    if fmt.startswith("{:") and fmt.endswith("}") and fmt.count("{") == 1:
+        return fmt[2:-1]
+    return None
+
+
+def _make_fmt(fmt):
+    """
+    Turn a field's format string into a one-argument callable, once.
+    - '{}'        -> str
+    - '{:<spec>}' -> format(value, spec), skipping str.format's template parse
+    - anything else falls back to the bound fmt.format method.
+    """
+    if fmt == "{}":
+        return str
+    spec = _fmt_spec(fmt)
+    if spec is not None:
+        return lambda v, _spec=spec: format(v, _spec)
+    return fmt.format
+
+
+def _compile_row(fmts):
+    """
+    Generate a straight-line function that formats a whole row of raw values:
+
+        def _row(v):
+            return [str(v[0]), str(v[1]), format(v[2], '.2f'), ...]
+
+    No per-field loop or try/except; the source is built once from the
+    field list (the same trick dataclasses uses to generate __init__).
+    """
+    namespace = {}
+    exprs = []
+    for i, fmt in enumerate(fmts):
+        spec = _fmt_spec(fmt)
+        if fmt == "{}":
+            exprs.append(f"str(v[{i}])")
+        elif spec is not None:
+            exprs.append(f"format(v[{i}], {spec!r})")
+        else:
+            namespace[f"_f{i}"] = fmt.format
+            exprs.append(f"_f{i}(v[{i}])")
+    src = "def _row(v):\n    return [" + ", ".join(exprs) + "]\n"
+    exec(src, namespace)
+    return namespace["_row"]
+
+
+# Binary sink layout: one text header line "<struct fmt>\t<label>,<label>,...\n",
+# then fixed-size little-endian records. Column types are declared, not
+# guessed from the data: a field listed in binary_types uses that struct code
+# (e.g. "32s" = utf-8 text of at most 32 bytes); any other field is float64
+# ("d") if its format string is a float format ('{:.2f}'), else int64 ("q").
+# Missing values (None or '') are stored as NaN / _BIN_INT_NONE and come back
+# as empty cells from bin_to_csv().
+_BIN_INT_NONE = -2**63
+
+
+def _bin_code(key, fmt, binary_types):
+    if key in binary_types:
+        return binary_types[key]
+    spec = _fmt_spec(fmt)
+    if spec and spec[-1] in "fFeEgG%":
+        return "d"
+    return "q"
+
+
+def bin_to_csv(bin_file, csv_file):
+    """
+    Convert a file written with Reporter(..., binary_sink=...) to CSV offline.
+    """
+    with open(bin_file, "rb") as src:
+        fmt, labels = src.readline().decode("utf-8").rstrip("\n").split("\t")
+        rec = struct.Struct(fmt)
+        with open(csv_file, "w", newline="") as dst:
+            writer = csv.writer(dst)
+            writer.writerow(labels.split(","))
+            for row in rec.iter_unpack(src.read()):
+                writer.writerow(_bin_cell(v) for v in row)
+
+
+def _bin_cell(v):
+    """
+    One unpacked binary value as it would appear in the CSV.
+    """
+    if isinstance(v, bytes):
+        return v.rstrip(b"\0").decode("utf-8")
+    if v == _BIN_INT_NONE or v != v:  # missing int / NaN
+        return ""
+    return v
 
 
 class Reporter:
@@ -22,59 +124,189 @@ class Reporter:
     Each row of output comes from a dict mapping field keys → values.
     """
 
-    def __init__(self, fields, csv_file):
+    def __init__(self, fields, csv_file, log_console=True, binary_sink=None, binary_types=None):
         """
-        fields   : list of (key, label, format_string)
-                   key   = dictionary key in data dict
-                   label = column name for console/CSV
-                   fmt   = how to format the value (e.g., '{:.2f}')
-        csv_file : output file path
+        fields      : list of (key, label, format_string)
+                      key   = dictionary key in data dict
+                      label = column name for console/CSV
+                      fmt   = how to format the value (e.g., '{:.2f}')
+        csv_file    : output file path
+        log_console : if False, rows only go to the file (no console formatting)
+        binary_sink : optional .bin path; if set, rows are struct-packed there
+                      instead of written to csv_file (convert later with bin_to_csv)
+        binary_types: optional {key: struct code} for the binary sink, e.g.
+                      {"layer": "32s"}; needed for text fields (see _bin_code)
         """
         self.fields = fields
         self.csv_file = csv_file
+        self.log_console = log_console
         self.widths = None
-        self._init_csv()
 
-    def _init_csv(self):
+        # Keys, labels and formatters are built once here instead of being
+        # re-derived from self.fields (and fmt re-parsed) on every row.
+        self._keys = tuple(key for key, _, _ in fields)
+        self._labels = tuple(label for _, label, _ in fields)
+        self._fmt_fns = tuple(_make_fmt(fmt) for _, _, fmt in fields)
+        self._row = _compile_row([fmt for _, _, fmt in fields])
+
+        # Console lines wait here until flush_console() (once per round),
+        # rather than one print() per row.
+        self._stdout_buf = []
+
+        # Open the output once and keep it open; rows go through a 64 KB buffer
+        # instead of an open/append/close per row. The buffer is flushed on
+        # flush()/close(), and close() also runs at interpreter exit.
+        self.binary_sink = binary_sink
+        out_file = binary_sink or csv_file
+        os.makedirs(os.path.dirname(out_file) or ".", exist_ok=True)
+        if binary_sink:
+            # The record layout comes from the declared fields (see _bin_code).
+            codes = [_bin_code(key, fmt, binary_types or {}) for key, _, fmt in fields]
+            fmt = "<" + "".join(codes)
+            self._struct = struct.Struct(fmt)
+            self._bin_codes = codes
+            self._str_cols = [(i, struct.calcsize(c)) for i, c in enumerate(codes) if c.endswith("s")]
+            self._fh = open(binary_sink, "wb", buffering=1 << 16)
+            self._fh.write((fmt + "\t" + ",".join(self._labels) + "\n").encode("utf-8"))
+            self._write = self._write_binary
+        else:
+            self._fh = open(csv_file, "w", newline="", buffering=1 << 16)
+            self._writer = csv.writer(self._fh)
+            self._writer.writerow(self._labels)
+            self._write = self._writer.writerow
+        atexit.register(self.close)
+
+    def _write_binary(self, raw):
+        """
+        Pack one row of raw values into a fixed-size record.
+        """
+        for i, width in self._str_cols:
+            encoded = str(raw[i]).encode("utf-8")
+            if len(encoded) > width:
+                raise ValueError(
+                    f"{self._labels[i]!r} value {raw[i]!r} is {len(encoded)} bytes; "
+                    f"its binary column holds {width} (widen it in binary_types)"
+                )
+            raw[i] = encoded
+        try:
+            packed = self._struct.pack(*raw)
+        except struct.error:
+            # A value that does not match its column as-is (None, a float
+            # in an int column, ...): convert per column and try again.
+            packed = self._struct.pack(*self._bin_values(raw))
+        self._fh.write(packed)
+
+    def _bin_values(self, raw):
+        """
+        Convert raw values to their declared binary column types.
         """
-        Initialize CSV file with header row.
+        values = []
+        for v, code, label in zip(raw, self._bin_codes, self._labels):
+            if code == "d":
+                v = float("nan") if v is None or v == "" else float(v)
+            elif code == "q":
+                if v is None or v == "":
+                    v = _BIN_INT_NONE
+                elif isinstance(v, float) and v.is_integer():
+                    v = int(v)
+                elif not isinstance(v, int):
+                    raise ValueError(
+                        f"{label!r} value {v!r} is not an integer; "
+                        f"declare the field as 'd' in binary_types"
+                    )
+            values.append(v)
+        return values
+
+    def flush(self):
+        """
+        Push buffered CSV rows to disk (file stays open).
         """
-        with open(self.csv_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            header = [label for _, label, _ in self.fields]
-            writer.writerow(header)
+        if not self._fh.closed:
+            self._fh.flush()
+
+    def flush_console(self):
+        """
+        Write all buffered console lines to stdout in one call.
+        """
+        if self._stdout_buf:
+            sys.stdout.write("\n".join(self._stdout_buf) + "\n")
+            self._stdout_buf.clear()
+
+    def close(self):
+        """
+        Flush pending console lines, then flush and close the CSV file.
+        Safe to call more than once.
+        """
+        self.flush_console()
+        if not self._fh.closed:
+            self._fh.close()
 
     def report(self, data):
         """
-        Write one row to console and CSV from `data` dict.
+        Write one row to the output file and queue it for the console from `data` dict.
+        Call flush_console() to print queued rows.
         """
-        # Apply formatting for console display
-        formatted = []
-        for key, label, fmt in self.fields:
-            val = data.get(key, "")
-            try:
-                formatted.append(fmt.format(val))
-            except (ValueError, TypeError):
-                formatted.append(str(val))
+        # Raw values in field order (used for both console and CSV)
+        get = data.get
+        raw = [get(key, "") for key in self._keys]
+
+        # Format for the console only if console output is on.
+        if self.log_console:
+            self._queue_console(raw)
+
+        # Append raw values (unformatted) to the CSV (or binary sink).
+        # csv.writer is kept on purpose: its C quoting loop beats a generated
+        # ",".join(...) / f-string line builder for these rows, and it still
+        # quotes any label that happens to contain a comma or quote.
+        self._write(raw)
+
+    def report_many(self, rows):
+        """
+        Same as calling report() for each dict in `rows`, but the CSV rows
+        go out in a single writerows() call (e.g., all servers of a round).
+        """
+        keys = self._keys
+        raws = [[row.get(key, "") for key in keys] for row in rows]
+
+        if self.log_console:
+            for raw in raws:
+                self._queue_console(raw)
+
+        if self.binary_sink:
+            for raw in raws:
+                self._write_binary(raw)
+        else:
+            self._writer.writerows(raws)
+
+    def _queue_console(self, raw):
+        """
+        Format one row of raw values and add it to the console buffer.
+        """
+        # Apply formatting for console display. The generated _row handles
+        # the normal case; if a value does not fit its format (e.g. a missing
+        # key gives ''), redo the row field by field with str() fallbacks.
+        try:
+            formatted = self._row(raw)
+        except (ValueError, TypeError):
+            formatted = []
+            for val, fn in zip(raw, self._fmt_fns):
+                try:
+                    formatted.append(fn(val))
+                except (ValueError, TypeError):
+                    formatted.append(str(val))
 
         # If first call, print header and separator
         if self.widths is None:
-            labels = [label for _, label, _ in self.fields]
+            labels = self._labels
             self.widths = [max(len(label), len(val)) for label, val in zip(labels, formatted)]
             header_line = " | ".join(label.ljust(w) for label, w in zip(labels, self.widths))
             separator = "-+-".join("-" * w for w in self.widths)
-            print(header_line)
-            print(separator)
+            self._stdout_buf.append(header_line)
+            self._stdout_buf.append(separator)
 
-        # Print row to console
+        # Queue row for the console
         line = " | ".join(val.ljust(w) for val, w in zip(formatted, self.widths))
-        print(line)
-
-        # Append raw values (unformatted) to CSV
-        with open(self.csv_file, "a", newline="") as f:
-            writer = csv.writer(f)
-            row = [data.get(key, "") for key, _, _ in self.fields]
-            writer.writerow(row)
+        self._stdout_buf.append(line)
 
 
 # ---------------------------------------------------------------------
@@ -112,5 +344,18 @@ TASK_FIELDS = [
     ("failed",      "Failed",       "{}"),
 ]
 
+# Binary sink column types for fields that are not plain numbers
+# (only used when SIMULATION["binary_sink"] is set).
+TASK_BINARY_TYPES = {
+    "layer": "32s",
+}
+
 # Reporter instance used by the simulator
-task_reporter = Reporter(TASK_FIELDS, "results/task_metrics_log.csv")
+# (set SIMULATION["log_assignments"] = False in config/config.py for CSV-only runs)
+task_reporter = Reporter(
+    TASK_FIELDS,
+    "results/task_metrics_log.csv",
+    log_console=SIMULATION["log_assignments"],
+    binary_sink=SIMULATION.get("binary_sink"),
+    binary_types=TASK_BINARY_TYPES,
+)
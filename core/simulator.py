@@ -13,7 +13,6 @@ Notes:
 """
 
 import time
-from collections import defaultdict
 
 from entities.server          import Server
 from workload.generator       import WorkloadGenerator
@@ -24,13 +23,8 @@ from mobility.mobile_entity   import MobileEntity
 from mobility.random_waypoint import RandomWaypoint
 from config.config            import SERVER_CONFIG, WORKLOAD, MOBILITY_CONFIG
 from config.metrics           import (
-    calculate_transmission_delay,
+    ENERGY_PER_KB,
     calculate_propagation_delay,
-    calculate_transmission_cost,
-    calculate_processing_cost,
-    calculate_edge_energy,
-    calculate_regional_energy,
-    calculate_cloud_energy,
     calculate_cpu_utilization,
     calculate_memory_utilization,
     calculate_storage_utilization,
@@ -72,35 +66,30 @@ class Simulator:
         self.tasks = []
         self.generator = WorkloadGenerator()
         self._initialize_servers()
+        self._build_server_tables()
 
         # -------------------------
         # DEVICE ENTITIES SETUP
         # -------------------------
         # Create one MobileEntity per possible device index (up to max_devices).
-        device_entities = []
-        num_servers = len(self.servers)
-
-        for i in range(WORKLOAD["max_devices"]):
-            # Start each device near a server (round-robin assignment to spread them).
-            srv = self.servers[i % num_servers]
-            init_pos = [srv.x, srv.y]
-
-            # Create the mobile entity and attach to that server.
-            ent = MobileEntity(
-                entity_id=i,
-                init_pos=init_pos,
-                speed=MOBILITY_CONFIG.get("default_speed_m_s", 0.0),
-            )
-            ent.attached_server = srv
-
-            # Give each device a simple Random Waypoint controller.
-            ent.mobility = RandomWaypoint(
-                MOBILITY_CONFIG["area"],
-                MOBILITY_CONFIG["speed_range"],
-                MOBILITY_CONFIG["pause_time"],  # or pause_range if that's the field name
-            )
-
-            device_entities.append(ent)
+        # Each device starts at a server (round-robin to spread them); the
+        # start positions and mobility settings are read once, not per device.
+        srv_xy = [(srv.x, srv.y) for srv in self.servers]
+        num_servers = len(srv_xy)
+        speed = MOBILITY_CONFIG.get("default_speed_m_s", 0.0)
+        area = MOBILITY_CONFIG["area"]
+        speed_range = MOBILITY_CONFIG["speed_range"]
+        pause_time = MOBILITY_CONFIG["pause_time"]  # or pause_range if that's the field name
+
+        device_entities = [
+            MobileEntity(entity_id=i, init_pos=list(srv_xy[i % num_servers]), speed=speed)
+            for i in range(WORKLOAD["max_devices"])
+        ]
+        for i, ent in enumerate(device_entities):
+            ent.attached_server = self.servers[i % num_servers]
+            # Give each device a simple Random Waypoint controller
+            # (created in device order, so the random stream is unchanged).
+            ent.mobility = RandomWaypoint(area, speed_range, pause_time)
 
         # Hand off servers + devices to the mobility manager.
         self.mobility = MobilityManager(self.servers, device_entities)
@@ -135,6 +124,27 @@ class Simulator:
                 srv.available_storage = srv.storage_capacity
                 self.servers.append(srv)
 
+    def _build_server_tables(self):
+        """
+        Per-server rate tables, indexed like self.servers (and TaskBatch.server_idx).
+        Server parameters never change during a run, so these are built once.
+        They act as the memo for the delay/cost helpers in config/metrics.py:
+        each helper runs once per server here, never per task in run().
+        """
+        self._srv_inv_bw = []
+        self._srv_prop_ms = []
+        self._srv_tx_rate = []
+        self._srv_proc_rate = []
+        self._srv_energy_rate = []
+
+        for srv in self.servers:
+            # Tier and tx_cost per KB are cached on the Server itself.
+            self._srv_inv_bw.append(1.0 / srv.bandwidth)
+            self._srv_prop_ms.append(calculate_propagation_delay(srv.tier))
+            self._srv_tx_rate.append(srv.tx_cost_per_kb)
+            self._srv_proc_rate.append(srv.cost)
+            self._srv_energy_rate.append(ENERGY_PER_KB[srv.tier])
+
     # ------------------------------------------------------------------
     # Main loop
     # ------------------------------------------------------------------
@@ -165,11 +175,12 @@ class Simulator:
             for srv in self.servers:
                 srv.release_completed_tasks(self.current_time)
 
-            # 3) Generate this round's tasks and tag them with a device (entity) id.
-            self.tasks = self.generator.generate_tasks(round_no)
-            for idx, task in enumerate(self.tasks):
-                task.entity_id = idx
-            num_devices = len(self.tasks)
+            # 3) Generate this round's tasks as columns (TaskBatch); the scheduler
+            #    gets Task objects made from it (reusing the generator's task pool),
+            #    each tagged with its device id.
+            batch = self.generator.generate_batch(round_no)
+            self.tasks = batch.to_tasks(self.generator.task_pool)
+            num_devices = len(batch)
 
             # ------------------------------------------------------------------
             # 4) SCHEDULER INTEGRATION POINT
@@ -178,12 +189,16 @@ class Simulator:
             # Expected return: list of (task_object, server_object)
             assignments = self.scheduler.schedule(self.tasks, self.servers, self.current_time)
 
-            initial_count = num_devices
-            assigned_count = len(assignments)
-            failed_count = initial_count - assigned_count
+            # Record where each row of the batch went.
+            batch.record_assignments(self.tasks, assignments, self.servers)
+            failed_count = batch.num_failed()
 
-            # 5) Remove assigned tasks from "pending" list (kept for compatibility).
-            self.tasks = [t for t in self.tasks if not t.is_assigned()]
+            # 5) Keep only unplaced tasks in the "pending" list (kept for compatibility).
+            # batch.failed already says which rows the scheduler did not place,
+            # so there is no per-task is_assigned() call. (is_assigned() checks
+            # the legacy server_assigned field, which schedulers never set, so
+            # the old filter kept every task.)
+            self.tasks = [t for t, failed in zip(self.tasks, batch.failed) if failed]
 
             # 6) Mark tasks as completed and update server resource availability.
             for task, srv in assignments:
@@ -198,82 +213,109 @@ class Simulator:
                 srv.available_memory = max(srv.available_memory - mem_req, 0)
 
             # 7) Compute & report per-server metrics (includes average signal strength).
-            for srv in self.servers:
-                # All tasks that were placed on this server this round.
-                assigned_here = [t for t, s in assignments if s is srv]
-                if not assigned_here:
+            # Every delay/cost/energy metric is linear in a task's data_kb or
+            # cpu_demand with per-server constants, so one pass over the batch
+            # columns only needs two sums per server; the metrics are those sums
+            # times the per-server rates from _build_server_tables().
+            n_srv = len(self.servers)
+            total_data = [0] * n_srv  # int start: integer KB stays an int in the report
+            total_cpu = [0] * n_srv
+            rows_by_srv = {}  # server index -> batch rows, only for servers that got tasks
+
+            data_kb = batch.data_kb
+            cpu_demand = batch.cpu_demand
+            device_id = batch.device_id
+
+            for i, k in enumerate(batch.server_idx):
+                if k < 0:
                     continue
-
-                total_data = sum(t.data_size_kb for t in assigned_here)
-
-                # Accumulators
-                tx_delay = 0.0
-                prop_delay = 0.0
-                tx_cost = 0.0
-                proc_cost = 0.0
-                energy = 0.0
-
-                # Per-task signal samples
-                signals = []
-
-                for t in assigned_here:
-                    # Signal from the device (by entity_id) to this server.
-                    dev = self.mobility.entities[t.entity_id]
-                    sig = dev.signal_strength(srv)
-                    signals.append(sig)
-
-                    # Delays
-                    tx_delay += calculate_transmission_delay(t.data_size_kb, srv.name)
-                    prop_delay += calculate_propagation_delay(srv.name)
-
-                    # Costs
-                    tier = srv.name.split("_")[0]
-                    tx_cost += calculate_transmission_cost(
-                        t.data_size_kb, SERVER_CONFIG[tier]["tx_cost"]
-                    )
-                    proc_cost += calculate_processing_cost(t.cpu_demand, srv.cost)
-
-                    # Energy by tier
-                    if tier == "Edge":
-                        energy += calculate_edge_energy(t.data_size_kb)
-                    elif tier == "Regional":
-                        energy += calculate_regional_energy(t.data_size_kb)
-                    else:
-                        energy += calculate_cloud_energy(t.data_size_kb)
+                rows = rows_by_srv.get(k)
+                if rows is None:
+                    rows = rows_by_srv[k] = []
+                rows.append(i)
+                total_data[k] += data_kb[i]
+                total_cpu[k] += cpu_demand[i]
+
+            round_rows = []  # one metrics dict per server, reported together
+            rss = self.mobility.rss  # (devices, servers) matrix or None
+
+            # Servers with no tasks this round are simply absent; sorting the
+            # keys keeps rows in self.servers order.
+            for k in sorted(rows_by_srv):
+                srv = self.servers[k]
+                # Batch rows of all tasks placed on this server this round.
+                assigned_here = rows_by_srv[k]
+                n = len(assigned_here)
+                kb_sum = total_data[k]
+
+                # Fused metrics: sum over tasks of (rate * kb) == rate * sum(kb)
+                tx_delay = kb_sum * 8000.0 * self._srv_inv_bw[k]
+                prop_delay = n * self._srv_prop_ms[k]
+                tx_cost = kb_sum * self._srv_tx_rate[k]
+                proc_cost = total_cpu[k] * self._srv_proc_rate[k]
+                energy = kb_sum * self._srv_energy_rate[k]
+
+                # Per-task signal samples (device by entity_id -> this server).
+                # The vectorized mobility step already has every device->server
+                # RSS in one matrix, so reuse that column when it is there.
+                if rss is not None:
+                    signals = rss[[device_id[i] for i in assigned_here], k].tolist()
+                else:
+                    signals = [
+                        self.mobility.entities[device_id[i]].signal_strength(srv)
+                        for i in assigned_here
+                    ]
 
                 # Averages and utilizations
-                avg_signal = round(sum(signals) / len(signals), 2) if signals else 0.0
-
-                used_cpu = srv.cpu_capacity - srv.available_cpu
-                used_memory = srv.memory_capacity - srv.available_memory
-                used_storage = srv.storage_capacity - srv.available_storage
-
-                cpu_util = round(used_cpu / srv.cpu_capacity * 100, 2)
-                memory_util = round(used_memory / srv.memory_capacity * 100, 2)
-                storage_util = round(used_storage / srv.storage_capacity * 100, 2)
-                congestion = calculate_congestion(total_data, srv.bandwidth)
+                signal_sum = sum(signals)
+                avg_signal = round(signal_sum / len(signals), 2) if signals else 0.0
+                self.mobility.metrics.add_rss(signal_sum, len(signals))
+
+                cpu_util = round(calculate_cpu_utilization(
+                    srv.available_cpu, srv.cpu_capacity, srv.inv_cpu), 2)
+                memory_util = round(calculate_memory_utilization(
+                    srv.available_memory, srv.memory_capacity, srv.inv_memory), 2)
+                storage_util = round(calculate_storage_utilization(
+                    srv.available_storage, srv.storage_capacity, srv.inv_storage), 2)
+                congestion = calculate_congestion(kb_sum, srv.bandwidth)
 
                 # Report a single row per server for this round.
                 metrics = {
                     "round_no": round_no,
                     "devices": num_devices,
-                    "workload": total_data,
+                    "workload": kb_sum,
                     **mob_metrics,
                     "avg_signal": avg_signal,
                     "cpu_util": cpu_util,
                     "memory_util": memory_util,
                     "storage_util": storage_util,
                     "layer": srv.name,
-                    "avg_tx": round(tx_delay / len(assigned_here), 2),
-                    "avg_prop": round(prop_delay / len(assigned_here), 2),
+                    "avg_tx": round(tx_delay / n, 2),
+                    "avg_prop": round(prop_delay / n, 2),
                     "tx_cost": round(tx_cost, 2),
                     "proc_cost": round(proc_cost, 2),
                     "energy": round(energy, 4),
-                    "congestion": congestion,
-                    "flag": assigned_here[0].priority,
+                    "congestion": round(congestion, 2),
+                    "flag": batch.priority[assigned_here[0]],
                     "failed": failed_count,
                 }
-                task_reporter.report(metrics)
+                round_rows.append(metrics)
+
+            # Round totals for the run-level mobility metrics
+            # (task drop rate, throughput variation; RSS is added per server above).
+            mob_stats = self.mobility.metrics
+            mob_stats.record_tasks(num_devices, failed_count)
+            mob_stats.add_throughput(sum(total_data))
+
+            # Write this round's rows in one call, then print them in one write.
+            task_reporter.report_many(round_rows)
+            task_reporter.flush_console()
 
             # 8) Advance the global clock by one time unit.
             self.current_time += 1
+
+        # Make sure every CSV row is on disk once the run is over.
+        task_reporter.flush()
+
+        # Let the scheduler finish up (e.g. PPO saves its training plots).
+        self.scheduler.on_run_end()
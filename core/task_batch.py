@@ -0,0 +1,163 @@
+"""
+RegionalEdgeSimPy — Educational Release
+
+Author: Dr. Afzal Badshah
+Department of Software Engineering, University of Sargodha
+Website: https://afzalbadshah.com/index.php/afzal-badshah/
+LinkedIn: https://www.linkedin.com/in/afzal-badshah-phd-305b03164/
+Discussion Forum: resp.afzalbadshah.com
+
+Notes:
+- Holds one round of task records column-wise (Structure-of-Arrays).
+- WorkloadGenerator fills a batch directly; Task objects are made from it
+  only for the scheduler (view()/to_tasks()).
+- Columns are typed stdlib arrays, so the core stays dependency-free;
+  NumPy users can view them without copying via to_numpy().
+"""
+
+from array import array
+from dataclasses import dataclass, field
+
+from entities.task import Task
+
+
+def _column(value, n):
+    """
+    n copies of value as one typed array: integers stay integers ("l"),
+    anything else is stored as float64 ("d"), so 10 KB is reported as 10
+    and 12.3 KB keeps its value.
+    """
+    return array("l" if isinstance(value, int) else "d", [value]) * n
+
+
+@dataclass
+class TaskBatch:
+    """
+    Row i describes the i-th task of a round:
+      data_kb, cpu_demand : int64 if the configured value is an int, else float64
+      storage_demand      : (same)
+      memory_demand       : (same)
+      priority            : int8 (task flag 1..3)
+      layer_idx           : int8 tier index (Edge=0, Regional=1, Cloud=2), -1 if unassigned
+      server_idx          : int16 index into the simulator's server list, -1 if unassigned
+      device_id           : entity id of the device that produced the task
+      failed              : 1 if the scheduler did not place the task, else 0
+
+    Students: metric code can loop over these columns (or NumPy views of them)
+    instead of walking Task objects one by one.
+    """
+
+    data_kb: array = field(default_factory=lambda: array("d"))
+    cpu_demand: array = field(default_factory=lambda: array("d"))
+    storage_demand: array = field(default_factory=lambda: array("d"))
+    memory_demand: array = field(default_factory=lambda: array("d"))
+    priority: array = field(default_factory=lambda: array("b"))
+    layer_idx: array = field(default_factory=lambda: array("b"))
+    server_idx: array = field(default_factory=lambda: array("h"))
+    device_id: array = field(default_factory=lambda: array("l"))
+    failed: array = field(default_factory=lambda: array("B"))
+
+    def __len__(self):
+        return len(self.data_kb)
+
+    @classmethod
+    def uniform(cls, n, demand, data_kb, priorities):
+        """
+        Allocate a batch of n identical-demand tasks in one go
+        (used by WorkloadGenerator.generate_batch()).
+        Each column is a single typed allocation; no Task objects are made.
+        """
+        return cls(
+            data_kb=_column(data_kb, n),
+            cpu_demand=_column(demand, n),
+            storage_demand=_column(demand, n),
+            memory_demand=_column(demand, n),
+            priority=array("b", priorities),
+            layer_idx=array("b", [-1]) * n,
+            server_idx=array("h", [-1]) * n,
+            device_id=array("l", range(n)),
+            failed=array("B", [1]) * n,
+        )
+
+    def record_assignments(self, tasks, assignments, servers):
+        """
+        Fill server_idx / layer_idx / failed from the scheduler's
+        (task, server) pairs; tasks[i] must be the task of row i.
+        """
+        srv_row = {id(s): i for i, s in enumerate(servers)}
+        srv_layer = [s.tier_idx for s in servers]
+        task_row = {id(t): i for i, t in enumerate(tasks)}
+
+        for task, srv in assignments:
+            i = task_row[id(task)]
+            k = srv_row[id(srv)]
+            self.server_idx[i] = k
+            self.layer_idx[i] = srv_layer[k]
+            self.failed[i] = 0
+
+    def view(self, i):
+        """
+        Task object for row i, for schedulers that work with objects.
+        """
+        task = Task(
+            cpu_demand=self.cpu_demand[i],
+            storage_demand=self.storage_demand[i],
+            memory_demand=self.memory_demand[i],
+            bandwidth=self.data_kb[i],
+            latency=None,
+            priority=self.priority[i],
+        )
+        task.data_size_kb = self.data_kb[i]
+        task.entity_id = self.device_id[i]
+        return task
+
+    def to_tasks(self, pool=None):
+        """
+        Task objects for every row (what scheduler.schedule() receives).
+
+        pool: optional list of Task objects to reuse (e.g. last round's).
+        Pooled tasks are reset() and refilled from this batch; the pool grows
+        if the batch is longer. Reused tasks are only valid until the pool is
+        used again.
+        """
+        n = len(self)
+        if pool is None:
+            return [self.view(i) for i in range(n)]
+
+        # Reuse existing objects first, then create the rest, so task ids
+        # still run in row order.
+        reuse = min(len(pool), n)
+        cpu, storage, memory = self.cpu_demand, self.storage_demand, self.memory_demand
+        data_kb, priority, device_id = self.data_kb, self.priority, self.device_id
+        for i in range(reuse):
+            task = pool[i]
+            task.reset(priority[i])
+            task.cpu_demand = cpu[i]
+            task.storage_demand = storage[i]
+            task.memory_demand = memory[i]
+            task.bandwidth = task.data_size_kb = data_kb[i]
+            task.latency = None
+            task.entity_id = device_id[i]
+        pool.extend(self.view(i) for i in range(reuse, n))
+        return pool[:n]
+
+    def num_failed(self):
+        return sum(self.failed)
+
+    def to_numpy(self):
+        """
+        Zero-copy NumPy views of every column (needs NumPy installed).
+        """
+        import numpy as np
+
+        return {
+            "data_kb": np.frombuffer(self.data_kb, dtype=np.dtype(self.data_kb.typecode)),
+            "cpu_demand": np.frombuffer(self.cpu_demand, dtype=np.dtype(self.cpu_demand.typecode)),
+            "storage_demand": np.frombuffer(self.storage_demand, dtype=np.dtype(self.storage_demand.typecode)),
+            "memory_demand": np.frombuffer(self.memory_demand, dtype=np.dtype(self.memory_demand.typecode)),
+            "priority": np.frombuffer(self.priority, dtype=np.int8),
+            "layer_idx": np.frombuffer(self.layer_idx, dtype=np.int8),
+            "server_idx": np.frombuffer(self.server_idx, dtype=np.int16),
+            "device_id": np.frombuffer(self.device_id, dtype=np.dtype("l")),
+            "failed": np.frombuffer(self.failed, dtype=np.bool_),
+        }
@@ -12,7 +12,8 @@ Notes:
 """
 
 import math
-from config.config import WORKLOAD, SERVER_CONFIG, MOBILITY_CONFIG
+from config.config import WORKLOAD, SERVER_CONFIG, MOBILITY_CONFIG, LAYER_IDX
+from config.metrics import calculate_edge_energy, calculate_regional_energy, calculate_cloud_energy
 from mobility.random_waypoint import RandomWaypoint
 
 
@@ -26,6 +27,17 @@ class Server:
     - Physical position (x, y) and optional mobility
     """
 
+    # Fixed attribute set (see Task.__slots__); add names here for new fields.
+    __slots__ = (
+        "name", "index", "cpu_capacity", "storage_capacity", "memory_capacity",
+        "bandwidth", "latency", "cost", "tx_cost",
+        "tier", "tier_idx", "tx_cost_per_kb", "_energy_fn",
+        "inv_cpu", "inv_memory", "inv_storage",
+        "x", "y", "location", "mobility",
+        "available_cpu", "available_storage", "available_memory",
+        "running_tasks", "total_data_transferred_kb", "total_cost",
+    )
+
     def __init__(self, name, index, cpu_capacity, storage_capacity,
                  memory_capacity, bandwidth, latency, cost, tx_cost=0.0):
         # Basic details
@@ -39,8 +51,25 @@ class Server:
         self.cost = cost
         self.tx_cost = tx_cost
 
-        # Position setup (from SERVER_CONFIG)
+        # Reciprocal capacities (0.0 if a capacity is 0), so utilization
+        # multiplies instead of divides.
+        self.inv_cpu = 1.0 / cpu_capacity if cpu_capacity else 0.0
+        self.inv_memory = 1.0 / memory_capacity if memory_capacity else 0.0
+        self.inv_storage = 1.0 / storage_capacity if storage_capacity else 0.0
+
+        # Tier-derived values, looked up once here instead of per task
         tier = name.split('_')[0]  # e.g., "Edge_1" → "Edge"
+        self.tier = tier
+        if tier not in LAYER_IDX:
+            raise ValueError(f"Unknown server tier {tier!r} in {name!r}; expected one of {tuple(LAYER_IDX)}")
+        self.tier_idx = LAYER_IDX[tier]  # Edge=0, Regional=1, Cloud=2
+        self.tx_cost_per_kb = SERVER_CONFIG[tier]["tx_cost"]
+        self._energy_fn = {
+            "Edge": calculate_edge_energy,
+            "Regional": calculate_regional_energy,
+        }.get(tier, calculate_cloud_energy)
+
+        # Position setup (from SERVER_CONFIG)
         self.x, self.y = SERVER_CONFIG[tier]["positions"][self.index]
         self.location = self.x  # kept for backward compatibility
 
@@ -53,10 +82,7 @@ class Server:
             self.mobility = RandomWaypoint(area, speed_range, pause_time)
 
             # Start at configured static position
-            try:
-                self.mobility.pos = (self.x, self.y)
-            except AttributeError:
-                pass
+            self.mobility.x, self.mobility.y = self.x, self.y
 
             # Update to first simulated position
             self.x, self.y = self.mobility.next_position(0.0)
@@ -128,11 +154,17 @@ class Server:
         """
         Returns CPU, storage, and memory utilization percentages.
         """
-        cpu_util = 100 * (1 - self.available_cpu / self.cpu_capacity) if self.cpu_capacity else 0
-        storage_util = 100 * (1 - self.available_storage / self.storage_capacity) if self.storage_capacity else 0
-        memory_util = 100 * (1 - self.available_memory / self.memory_capacity) if self.memory_capacity else 0
+        cpu_util = 100 * (1 - self.available_cpu * self.inv_cpu) if self.cpu_capacity else 0
+        storage_util = 100 * (1 - self.available_storage * self.inv_storage) if self.storage_capacity else 0
+        memory_util = 100 * (1 - self.available_memory * self.inv_memory) if self.memory_capacity else 0
         return round(cpu_util, 2), round(storage_util, 2), round(memory_util, 2)
 
+    def energy(self, data_kb):
+        """
+        Energy for sending data_kb to this server (tier's energy model).
+        """
+        return self._energy_fn(data_kb)
+
     def congestion(self):
         """
         Returns congestion percentage based on transferred data and bandwidth.
@@ -11,9 +11,14 @@ Notes:
 - Functionality preserved; comments kept simple for student readability.
 """
 
+import itertools
 import uuid
 from config.config import WORKLOAD
 
+# In-process task ids: a counter is far cheaper than uuid4() per task.
+# Set WORKLOAD["use_uuid"] = True if your code expects string UUIDs.
+_id_counter = itertools.count()
+
 
 class Task:
     """
@@ -21,10 +26,20 @@ class Task:
     Holds resource demands, size, priority, status, timing, and basic metrics.
     """
 
+    # Fixed attribute set: no per-task __dict__ (less memory, faster access).
+    # Add a name here if you need to store a new field on tasks.
+    __slots__ = (
+        "id", "cpu_demand", "storage_demand", "memory_demand",
+        "bandwidth", "latency", "priority", "flag",
+        "server_assigned", "assigned_server", "data_size_kb",
+        "execution_start_time", "execution_end_time", "status",
+        "delay", "cost", "energy", "entity_id",
+    )
+
     def __init__(self, cpu_demand, storage_demand, memory_demand,
                  bandwidth, latency, priority=1):
         # Identity
-        self.id = str(uuid.uuid4())
+        self.id = str(uuid.uuid4()) if WORKLOAD.get("use_uuid", False) else next(_id_counter)
 
         # Resource demands (units are simulator-defined)
         self.cpu_demand = cpu_demand
@@ -60,6 +75,29 @@ class Task:
     # Lifecycle helpers
     # ------------------------------------------------------------------
 
+    def reset(self, priority=1):
+        """
+        Reuse this object as a brand-new task (new id, unassigned, no timing
+        or metrics); resource demands are kept. Used by the task pool in
+        WorkloadGenerator / TaskBatch.to_tasks().
+        """
+        self.id = str(uuid.uuid4()) if WORKLOAD.get("use_uuid", False) else next(_id_counter)
+        self.priority = priority
+        self.flag = priority
+        self.server_assigned = None
+        self.assigned_server = None
+        self.execution_start_time = None
+        self.execution_end_time = None
+        self.status = "created"
+        self.delay = 0.0
+        self.cost = 0.0
+        self.energy = 0.0
+        # A new Task has no device tag (entity_id) until someone sets one
+        try:
+            del self.entity_id
+        except AttributeError:
+            pass
+
     def set_server(self, server_name):
         """
         Mark this task as scheduled on a server.
@@ -124,9 +162,10 @@ class Task:
 
     def __str__(self):
         """
-        Human-readable summary (short ID).
+        Human-readable summary (UUID ids shortened to 6 characters;
+        counter ids are printed in full so they stay unique).
         """
-        short_id = self.id[:6]
+        short_id = self.id[:6] if isinstance(self.id, str) else self.id
         return (
             f"Task({short_id}) | CPU: {self.cpu_demand} | Storage: {self.storage_demand} | "
             f"Memory: {self.memory_demand} | Data: {self.data_size_kb}KB | "
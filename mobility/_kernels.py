@@ -0,0 +1,117 @@
+"""
+RegionalEdgeSimPy — Educational Release
+
+Author: Dr. Afzal Badshah
+Department of Software Engineering, University of Sargodha
+Website: https://afzalbadshah.com/index.php/afzal-badshah/
+LinkedIn: https://www.linkedin.com/in/afzal-badshah-phd-305b03164/
+Discussion Forum: resp.afzalbadshah.com
+
+Notes:
+- Numeric core of MobilityManager.update_all(): RandomWaypoint movement and
+  best server + handover threshold for every device, on plain arrays.
+- Compiled (in parallel over devices) with Numba when it is installed;
+  otherwise the same function runs as plain Python.
+- Needs NumPy, like mobility/mobility_vec.py.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit: return the function unchanged.
+        """
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+# fastmath without "nnan"/"ninf": best_rss/cur_rss start at -inf, and with
+# ninf the compiler may assume that value never appears.
+@njit(parallel=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"}, cache=True)
+def step(dev_xy, srv_xy, attached, threshold_db):
+    """
+    One handover step for all devices.
+
+    dev_xy       : (D, 2) device positions
+    srv_xy       : (S, 2) server positions
+    attached     : (D,) int index of each device's current server, -1 if none
+    threshold_db : RSS gain needed before a device hands over
+
+    Same rules as MobileEntity.pick_best_bs(): RSS = -20 * log10(max(d, 1)),
+    attach to the strongest server if unattached, otherwise switch only when
+    the gain is at least threshold_db.
+
+    Returns (new_attached, ho_count, rss), where rss is the (D, S) matrix of
+    signal values computed on the way (reused for reporting).
+    """
+    n_dev = dev_xy.shape[0]
+    n_srv = srv_xy.shape[0]
+    new_attached = attached.copy()
+    handed_over = np.zeros(n_dev, dtype=np.int64)
+    rss_out = np.empty((n_dev, n_srv))
+
+    for i in prange(n_dev):
+        a = attached[i]
+        best = 0
+        best_rss = -np.inf
+        cur_rss = -np.inf
+        for j in range(n_srv):
+            dx = dev_xy[i, 0] - srv_xy[j, 0]
+            dy = dev_xy[i, 1] - srv_xy[j, 1]
+            d = math.sqrt(dx * dx + dy * dy)
+            rss = -20.0 * math.log10(max(d, 1.0))
+            rss_out[i, j] = rss
+            if rss > best_rss:
+                best_rss = rss
+                best = j
+            if j == a:
+                cur_rss = rss
+
+        if a < 0:
+            new_attached[i] = best
+        elif best != a and best_rss - cur_rss >= threshold_db:
+            new_attached[i] = best
+            handed_over[i] = 1
+
+    return new_attached, handed_over.sum(), rss_out
+
+
+@njit(parallel=True, cache=True)
+def waypoint_step(state, dt):
+    """
+    One RandomWaypoint tick for a whole fleet, in place.
+
+    state : (N, 8) rows of [x, y, tx, ty, vx, vy, pause_time, moving]
+    dt    : time step in seconds
+
+    Same rules as RandomWaypoint.next_position(): a paused node counts its
+    pause down, a moving node steps by velocity * dt and stops once it is
+    within 1e-3 m of its target. Random draws are left to the caller, so
+    the result matches the Python model for the same seed.
+
+    Returns an (N,) int8 event array: 1 = pause ended (needs a new target
+    and speed), 2 = target reached (needs a new pause time), 0 = nothing.
+    """
+    n = state.shape[0]
+    events = np.zeros(n, dtype=np.int8)
+    for i in prange(n):
+        if state[i, 7] == 0.0:
+            state[i, 6] -= dt
+            if state[i, 6] <= 0.0:
+                events[i] = 1
+        else:
+            state[i, 0] = state[i, 0] + state[i, 4] * dt
+            state[i, 1] = state[i, 1] + state[i, 5] * dt
+            if math.hypot(state[i, 0] - state[i, 2], state[i, 1] - state[i, 3]) < 1e-3:
+                events[i] = 2
+    return events
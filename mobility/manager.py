@@ -14,23 +14,73 @@ Notes:
 
 import math
 from config.config import MOBILITY_CONFIG
-from mobility.mobile_entity import MobileEntity
+from mobility.mobile_entity import MobileEntity, nearest_point
+from mobility.random_waypoint import RandomWaypoint
 
 
 class MobilityMetrics:
     """
     Container for mobility statistics collected over time.
+    Derived values (ratios, throughput range) are updated as events are
+    recorded, so reading them at report time is a plain attribute access.
     """
     def __init__(self):
         self.total_handovers = 0
         self.handover_attempts = 0
         self.total_handover_delay_ms = 0
-        self.rss_samples = []
+        self.rss_sum = 0.0   # running RSS total (no per-sample list kept)
+        self.rss_count = 0
         self.total_outage_time_ms = 0
         self.dropped_tasks = 0
         self.total_tasks = 0
         self.throughputs = []
 
+        # Maintained incrementally by the record_*/add_* methods below
+        self.handover_success_ratio = 0.0
+        self.task_drop_rate = 0.0
+        self.throughput_min = None
+        self.throughput_max = None
+        self.throughput_range = 0.0
+
+    def add_rss(self, total, count=1):
+        """
+        Add RSS samples (dB) to the running average: their sum and how many
+        (add_rss(sample) for a single sample).
+        """
+        self.rss_sum += total
+        self.rss_count += count
+
+    def record_handover(self, success, delay_ms=0):
+        """
+        Count one handover attempt (and its delay if it went through).
+        """
+        self.handover_attempts += 1
+        if success:
+            self.total_handovers += 1
+            self.total_handover_delay_ms += delay_ms
+        self.handover_success_ratio = self.total_handovers / self.handover_attempts
+
+    def record_tasks(self, count, dropped=0):
+        """
+        Count one round's tasks, and how many of them were dropped.
+        """
+        self.total_tasks += count
+        self.dropped_tasks += dropped
+        if self.total_tasks:
+            self.task_drop_rate = self.dropped_tasks / self.total_tasks
+
+    def add_throughput(self, value):
+        """
+        Store a throughput sample (KB placed in one round) and keep a
+        running min/max.
+        """
+        self.throughputs.append(value)
+        if self.throughput_min is None or value < self.throughput_min:
+            self.throughput_min = value
+        if self.throughput_max is None or value > self.throughput_max:
+            self.throughput_max = value
+        self.throughput_range = self.throughput_max - self.throughput_min
+
 
 class MobilityManager:
     """
@@ -50,6 +100,33 @@ class MobilityManager:
         self.ho_count = 0
         self.ho_delay = 0
         self.time_step_ms = MOBILITY_CONFIG.get("time_step_ms", 100)
+        self.metrics = MobilityMetrics()  # running handover statistics
+
+        # Optional NumPy path: server positions stacked into an (S, 2) array,
+        # rebuilt in update_all() only when servers move. With Numba installed
+        # the whole handover step runs in mobility/_kernels.py.
+        # Static servers (no server mobility): their positions are stacked
+        # once so the nearest-server lookup needs no attribute reads.
+        self._servers_static = not any(getattr(s, "mobility", None) for s in servers)
+        self._static_xy = [(s.x, s.y) for s in servers] if self._servers_static else None
+
+        self.vectorized = MOBILITY_CONFIG.get("vectorized", False)
+        self._dev_xy = None  # (D, 2) device positions, kept by the vectorized path
+        self.rss = None      # (D, S) device->server RSS from the last step (vectorized path only)
+        if self.vectorized:
+            from mobility import mobility_vec, _kernels
+            self._vec = mobility_vec
+            self._kernels = _kernels if _kernels.HAVE_NUMBA else None
+            self._srv_xy = mobility_vec.server_xy(servers)
+            self._srv_row = {id(s): k for k, s in enumerate(servers)}
+            # Devices that all use RandomWaypoint move as one array (WaypointFleet).
+            models = [getattr(e, "mobility", None) for e in self.entities]
+            if models and all(isinstance(m, RandomWaypoint) for m in models):
+                self._fleet = mobility_vec.WaypointFleet(models, self._kernels)
+            else:
+                self._fleet = None
+                if self.entities:
+                    self._device_xy()  # fail now, not mid-run, on 1D/mixed devices
 
     def update_all(self):
         """
@@ -60,21 +137,50 @@ class MobilityManager:
             (handover_count, total_handover_delay_ms)
         """
         # Update server mobility (if enabled per server)
+        servers_moved = False
         for srv in self.servers:
             if hasattr(srv, "mobility") and srv.mobility:
                 srv.x, srv.y = srv.mobility.next_position(self.time_step_ms)
                 srv.location = srv.x  # keep legacy 1D location updated
+                servers_moved = True
 
-        # Update device mobility and evaluate handovers
-        for ent in self.entities:
-            # Move device
-            if hasattr(ent, "mobility") and ent.mobility:
-                ent.position = ent.mobility.next_position(self.time_step_ms)
-            else:
-                ent.move(self.time_step_ms)
+        # Move devices
+        if self.vectorized and self._fleet is not None:
+            # One array step for every device (same positions as the loop below)
+            self._dev_xy = self._fleet.advance_all(self.time_step_ms)
+            for ent, (x, y) in zip(self.entities, self._dev_xy.tolist()):
+                ent.position = (x, y)
+        else:
+            for ent in self.entities:
+                if hasattr(ent, "mobility") and ent.mobility:
+                    ent.position = ent.mobility.next_position(self.time_step_ms)
+                else:
+                    ent.move(self.time_step_ms)
+
+        # Optional: strongest server for every (2D) device in one NumPy call
+        best_idx = None
+        if self.vectorized and self.entities:
+            if servers_moved:
+                self._srv_xy = self._vec.server_xy(self.servers)
+            if self._fleet is None:
+                self._dev_xy = self._device_xy()
+            if self._kernels is not None:
+                self._kernel_handovers(self._dev_xy)
+                return self.ho_count, self.ho_delay
+            self.rss = self._vec.rss_matrix(self._dev_xy, self._srv_xy)
+            best_idx = self.rss.argmax(axis=1)
 
+        # Evaluate handovers
+        nearest = self.nearest if self._servers_static and best_idx is None else None
+        for n, ent in enumerate(self.entities):
             # Attach to best server; possibly hand over
-            new_bs = ent.pick_best_bs(self.servers)
+            if best_idx is not None:
+                best = self.servers[best_idx[n]]
+            elif nearest is not None and isinstance(ent.position, (list, tuple)):
+                best = self.servers[nearest(ent.position)[0]]
+            else:
+                best = None
+            new_bs = ent.pick_best_bs(self.servers, best)
             if ent.attached_server is None:
                 ent.attached_server = new_bs
             elif new_bs != ent.attached_server:
@@ -82,13 +188,81 @@ class MobilityManager:
                 old_sig = ent.signal_strength(ent.attached_server)
                 new_sig = ent.signal_strength(new_bs)
                 delta = new_sig - old_sig
-                if delta >= MOBILITY_CONFIG.get("handover_threshold_db", 3):
+                ho_latency = MOBILITY_CONFIG.get("handover_latency_ms", 20)
+                success = delta >= MOBILITY_CONFIG.get("handover_threshold_db", 3)
+                if success:
                     ent.attached_server = new_bs
                     self.ho_count += 1
-                    self.ho_delay += MOBILITY_CONFIG.get("handover_latency_ms", 20)
+                    self.ho_delay += ho_latency
+                self.metrics.record_handover(success, ho_latency)
 
         return self.ho_count, self.ho_delay
 
+    def _device_xy(self):
+        """
+        (D, 2) array of device positions for the vectorized path, which
+        only handles 2D ([x, y]) devices.
+        """
+        np = self._vec.np
+        try:
+            xy = np.asarray([ent.position for ent in self.entities], dtype=np.float64)
+        except ValueError:  # mixed 1D/2D positions
+            xy = None
+        if xy is None or xy.ndim != 2 or xy.shape[1] != 2:
+            raise ValueError(
+                'MOBILITY_CONFIG["vectorized"] needs 2D ([x, y]) device positions; '
+                "set it to False for 1D or mixed 1D/2D devices."
+            )
+        return xy
+
+    def sync_models(self):
+        """
+        Vectorized path: copy the WaypointFleet state back onto every
+        device's RandomWaypoint model (ent.mobility), so the models can be
+        read directly. Nothing to do on the default path.
+        """
+        if self.vectorized and self._fleet is not None:
+            self._fleet.sync()
+
+    def nearest(self, pos):
+        """
+        (index, distance) of the closest static server to a 2D position.
+        Strongest signal == closest server, so this is the best base station
+        (same rule as MobileEntity._best_by_distance(), via nearest_point()).
+        """
+        k, d2 = nearest_point(pos[0], pos[1], self._static_xy)
+        return k, math.sqrt(d2)
+
+    def _kernel_handovers(self, dev_xy):
+        """
+        Run the compiled handover step and write the new attachments back
+        onto the MobileEntity objects.
+        """
+        np = self._vec.np
+        srv_row = self._srv_row
+        attached = np.array(
+            [srv_row[id(e.attached_server)] if e.attached_server is not None else -1
+             for e in self.entities],
+            dtype=np.int64,
+        )
+        new_attached, ho, self.rss = self._kernels.step(
+            dev_xy,
+            self._srv_xy,
+            attached,
+            float(MOBILITY_CONFIG.get("handover_threshold_db", 3)),
+        )
+
+        servers = self.servers
+        for n in np.flatnonzero(new_attached != attached):
+            self.entities[n].attached_server = servers[new_attached[n]]
+
+        ho = int(ho)
+        ho_latency = MOBILITY_CONFIG.get("handover_latency_ms", 20)
+        self.ho_count += ho
+        self.ho_delay += ho * ho_latency
+        for _ in range(ho):
+            self.metrics.record_handover(True, ho_latency)
+
     def get_metrics(self):
         """
         Compute a simple dispersion metric (average distance from centroid)
@@ -97,26 +271,29 @@ class MobilityManager:
         Returns:
             dict with keys: avg_pos, ho_count, ho_delay
         """
-        positions = []
-        for ent in self.entities:
-            pos = ent.position
-            # Normalize to 2D [x, y]
-            if isinstance(pos, (list, tuple)):
-                positions.append(pos)
-            else:
-                positions.append([pos, 0.0])
-
-        n = len(positions)
+        n = len(self.entities)
         if n == 0:
             return {"avg_pos": 0.0, "ho_count": self.ho_count, "ho_delay": self.ho_delay}
 
-        xs = [p[0] for p in positions]
-        ys = [p[1] for p in positions]
-        x_bar = sum(xs) / n
-        y_bar = sum(ys) / n
+        if self._dev_xy is not None:
+            # Vectorized path: positions are already an (D, 2) array from update_all()
+            np = self._vec.np
+            xy = self._dev_xy
+            c = xy.mean(axis=0)
+            avg_disp = float(np.hypot(xy[:, 0] - c[0], xy[:, 1] - c[1]).mean())
+        else:
+            # One list of 2D points (1D positions become [pos, 0.0]), then
+            # generator sums over it; no separate xs/ys lists.
+            pts = [
+                pos if isinstance(pos, (list, tuple)) else (pos, 0.0)
+                for pos in (ent.position for ent in self.entities)
+            ]
+            x_bar = sum(p[0] for p in pts) / n
+            y_bar = sum(p[1] for p in pts) / n
 
-        # Average Euclidean distance from centroid
-        avg_disp = sum(math.hypot(x - x_bar, y - y_bar) for x, y in zip(xs, ys)) / n
+            # Average Euclidean distance from centroid
+            hypot = math.hypot
+            avg_disp = sum(hypot(p[0] - x_bar, p[1] - y_bar) for p in pts) / n
 
         return {
             "avg_pos": round(avg_disp, 2),
@@ -17,28 +17,71 @@ import math
 from config.config import MOBILITY_CONFIG
 
 
+def nearest_point(px, py, points):
+    """
+    (index, squared distance) of the point in `points` (iterable of (x, y))
+    closest to (px, py), without any sqrt/log10: RSS = -20 * log10(max(d, 1))
+    falls as distance grows, so the strongest server is the smallest max(d², 1).
+    The clamp keeps ties (d ≤ 1 m) resolving to the first point, as max() does.
+    Shared by MobileEntity and MobilityManager.nearest().
+    """
+    best_k = 0
+    best_d2 = math.inf
+    for k, (sx, sy) in enumerate(points):
+        dx = px - sx
+        dy = py - sy
+        d2 = max(dx * dx + dy * dy, 1.0)
+        if d2 < best_d2:
+            best_k = k
+            best_d2 = d2
+    return best_k, best_d2
+
+
 class MobileEntity:
     """
     Represents a mobile node in the simulation.
     It can be placed in 1D (float position) or 2D ([x, y]) space.
     """
 
+    # Fixed attribute set (see Task.__slots__); `mobility` is set by the simulator.
+    __slots__ = (
+        "id", "_position", "_is_2d", "_sig_cache", "speed", "attached_server",
+        "ho_latency", "ho_threshold_db", "mobility",
+    )
+
     def __init__(self, entity_id, init_pos, speed):
         self.id = entity_id
-        self.position = init_pos  # starting position (1D float or 2D list/tuple)
+        self._sig_cache = {}      # server position -> RSS, valid until this entity moves
+        self._position = init_pos  # starting position (1D float or 2D list/tuple)
+        # 1D or 2D is decided once here (and again only if the position
+        # changes kind), so the methods below need no isinstance() checks.
+        self._is_2d = isinstance(init_pos, (list, tuple))
         self.speed = speed        # meters per second
         self.attached_server = None
         self.ho_latency = MOBILITY_CONFIG["handover_latency_ms"]
         self.ho_threshold_db = MOBILITY_CONFIG["handover_threshold_db"]
 
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        # Cached signal values are only valid for the old position.
+        if value != self._position:
+            self._sig_cache.clear()
+        self._position = value
+        if self._is_2d != isinstance(value, (list, tuple)):
+            self._is_2d = not self._is_2d
+
     def move(self, dt_ms):
         """
         Update position over time interval dt_ms.
         - In 1D: simply shift position by speed * time.
         - In 2D: leave movement to an external mobility model like RandomWaypoint.
         """
-        if isinstance(self.position, (int, float)):
-            self.position += self.speed * (dt_ms / 1000)
+        if not self._is_2d:
+            self.position = self._position + self.speed * (dt_ms / 1000)
         # If position is a list/tuple, movement is handled externally.
 
     def signal_strength(self, server):
@@ -47,31 +90,57 @@ class MobileEntity:
         - If position is 2D: use Euclidean distance to server.x/server.y.
         - If 1D: use absolute difference to server.location.
         Formula: RSS ≈ -20 * log10(distance)
+        (Server always sets x, y and location, so they are read directly.)
+
+        Results are memoized per server position until this entity moves, so
+        the handover checks and the simulator's report reuse one hypot/log10
+        per (entity, server) per step.
         """
+        pos = self._position
+
         # Determine distance
-        if isinstance(self.position, (list, tuple)):
-            sx = getattr(server, "x", getattr(server, "location", 0))
-            sy = getattr(server, "y", 0)
-            dx = self.position[0] - sx
-            dy = self.position[1] - sy
-            dist = math.hypot(dx, dy)
+        if self._is_2d:
+            sx = server.x
+            sy = server.y
+            key = (sx, sy)
+            rss = self._sig_cache.get(key)
+            if rss is not None:
+                return rss
+            dist = math.hypot(pos[0] - sx, pos[1] - sy)
         else:
-            dist = abs(self.position - getattr(server, "location", 0))
+            key = server.location
+            rss = self._sig_cache.get(key)
+            if rss is not None:
+                return rss
+            dist = abs(pos - key)
 
         # Path-loss model (avoid log10(0) by using max(dist, 1))
-        return -20 * math.log10(max(dist, 1))
+        rss = self._sig_cache[key] = -20 * math.log10(max(dist, 1))
+        return rss
+
+    def _best_by_distance(self, servers):
+        """
+        Strongest server by distance alone (see nearest_point()).
+        """
+        pos = self._position
+        if self._is_2d:
+            k, _ = nearest_point(pos[0], pos[1], ((s.x, s.y) for s in servers))
+            return servers[k]
+        return min(servers, key=lambda server: max(abs(pos - server.location), 1.0))
 
-    def pick_best_bs(self, servers):
+    def pick_best_bs(self, servers, best_server=None):
         """
         Select the server with the highest signal strength.
         Only switch (handover) if improvement ≥ threshold.
+        best_server: strongest server if the caller already found it
+                     (e.g., MobilityManager's vectorized search).
         """
-        best_server = max(servers, key=self.signal_strength)
-        if (
-            self.attached_server is None
-            or self.signal_strength(best_server) - self.signal_strength(self.attached_server)
-            >= self.ho_threshold_db
-        ):
+        if best_server is None:
+            best_server = self._best_by_distance(servers)
+        if self.attached_server is None or best_server is self.attached_server:
+            return best_server
+        # RSS (log10) is only computed for the threshold check.
+        if self.signal_strength(best_server) - self.signal_strength(self.attached_server) >= self.ho_threshold_db:
             return best_server
         return self.attached_server
 
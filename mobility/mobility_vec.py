@@ -0,0 +1,129 @@
+"""
+RegionalEdgeSimPy — Educational Release
+
+Author: Dr. Afzal Badshah
+Department of Software Engineering, University of Sargodha
+Website: https://afzalbadshah.com/index.php/afzal-badshah/
+LinkedIn: https://www.linkedin.com/in/afzal-badshah-phd-305b03164/
+Discussion Forum: resp.afzalbadshah.com
+
+Notes:
+- Batch (NumPy) device -> server RSS matrix, using the same path-loss model
+  as MobileEntity.signal_strength: RSS = -20 * log10(max(d, 1)).
+- WaypointFleet: moves many RandomWaypoint nodes with one array update.
+- Optional: needs NumPy. Used by MobilityManager only when
+  MOBILITY_CONFIG["vectorized"] is True; the default path is plain Python.
+"""
+
+import math
+import random
+
+import numpy as np
+
+
+def server_xy(servers):
+    """
+    Stack server positions into an (S, 2) float array.
+    """
+    return np.array([[s.x, s.y] for s in servers], dtype=np.float64)
+
+
+def rss_matrix(dev_xy, srv_xy):
+    """
+    RSS from every device to every server, shape (D, S), in one expression.
+    dev_xy: (D, 2) device positions (array or list of pairs),
+    srv_xy: (S, 2) server positions.
+    """
+    dev_xy = np.asarray(dev_xy, dtype=np.float64)
+    d = np.hypot(dev_xy[:, 0, None] - srv_xy[None, :, 0],
+                 dev_xy[:, 1, None] - srv_xy[None, :, 1])
+    return -20.0 * np.log10(np.maximum(d, 1.0))
+
+
+class WaypointFleet:
+    """
+    Drives a list of RandomWaypoint models as one (N, 8) state array:
+    columns [x, y, tx, ty, vx, vy, pause_time, moving].
+
+    advance_all(dt_ms) gives the same positions as calling next_position()
+    on every model in order: the per-tick math runs on the whole array
+    (compiled step from mobility/_kernels.py if given, else NumPy), and only
+    the few nodes that change state draw new random values, in node order,
+    through their own model.
+
+    While the fleet is in use the array is the live state: the models' own
+    attributes (x, y, target, velocity, pause, speed) are only updated by
+    sync(). Call it before reading a model directly (changes made to a model
+    afterwards are not picked up by the fleet).
+    """
+
+    def __init__(self, models, kernels=None):
+        self.models = models
+        self._kernels = kernels
+        self.state = np.array(
+            [[m.x, m.y, m.tx, m.ty, m.vel_x, m.vel_y,
+              m.pause_time, m.state == "move"] for m in models],
+            dtype=np.float64,
+        )
+        self._speed = [m.speed for m in models]  # only changes at "pause ended"
+
+    def _step(self, dt):
+        """
+        Array version of the scalar tick; returns the event codes
+        (1 = pause ended, 2 = target reached).
+        """
+        if self._kernels is not None:
+            return self._kernels.waypoint_step(self.state, dt)
+
+        st = self.state
+        moving = st[:, 7] != 0.0
+        paused = ~moving
+        st[paused, 6] -= dt
+        st[moving, 0] += st[moving, 4] * dt
+        st[moving, 1] += st[moving, 5] * dt
+        events = np.zeros(len(st), dtype=np.int8)
+        events[paused & (st[:, 6] <= 0.0)] = 1
+        arrived = np.hypot(st[:, 0] - st[:, 2], st[:, 1] - st[:, 3]) < 1e-3
+        events[moving & arrived] = 2
+        return events
+
+    def advance_all(self, dt_ms):
+        """
+        Advance every node by dt_ms milliseconds.
+        Returns a new (N, 2) array of positions.
+        """
+        st = self.state
+        events = self._step(dt_ms / 1000.0)
+
+        for i in np.flatnonzero(events).tolist():
+            m = self.models[i]
+            row = st[i]
+            if events[i] == 1:
+                # Pause over: new target and speed, velocity toward the target
+                tx, ty = m._random_point()
+                speed = random.uniform(*m.speed_range)
+                dx = tx - row[0]
+                dy = ty - row[1]
+                dist = math.hypot(dx, dy) or 1.0  # avoid divide-by-zero
+                row[2], row[3] = tx, ty
+                row[4] = speed * dx / dist
+                row[5] = speed * dy / dist
+                row[7] = 1.0
+                self._speed[i] = speed
+            else:
+                # Target reached: pause for a while
+                row[6] = random.uniform(*m.pause_range)
+                row[7] = 0.0
+
+        return st[:, :2].copy()
+
+    def sync(self):
+        """
+        Copy the array state back onto the RandomWaypoint models, so each
+        model looks as if next_position() had been called on it directly.
+        """
+        for m, row, speed in zip(self.models, self.state.tolist(), self._speed):
+            m.x, m.y, m.tx, m.ty, m.vel_x, m.vel_y = row[:6]
+            m.pause_time = row[6]
+            m.state = "move" if row[7] else "pause"
+            m.speed = speed
@@ -13,7 +13,9 @@ Notes:
 """
 
 import random
-import math
+from math import hypot
+
+_uniform = random.uniform  # bound once; still the shared, seedable generator
 
 
 class RandomWaypoint:
@@ -30,6 +32,14 @@ class RandomWaypoint:
     - This is just one model; you can implement your own movement logic here.
     """
 
+    # One controller per device, so keep each instance small (no __dict__).
+    # Position and target are kept as plain floats (x, y, tx, ty) so a step
+    # updates numbers in place instead of building new tuples.
+    __slots__ = (
+        "area", "speed_range", "pause_range", "state",
+        "x", "y", "tx", "ty", "pause_time", "speed", "vel_x", "vel_y",
+    )
+
     def __init__(self, area, speed_range, pause_range):
         self.area = area
         self.speed_range = speed_range
@@ -39,20 +49,39 @@ class RandomWaypoint:
         self.state = "pause"
 
         # Pick initial random position and target
-        self.pos = self._random_point()
-        self.target = self._random_point()
+        self.x, self.y = self._random_point()
+        self.tx, self.ty = self._random_point()
 
         # Initial pause time and speed
-        self.pause_time = random.uniform(*pause_range)
+        self.pause_time = _uniform(*pause_range)
         self.speed = 0.0
+        self.vel_x = self.vel_y = 0.0
+
+    # Tuple views, for code that reads/writes pos or target as a pair
+    @property
+    def pos(self):
+        return (self.x, self.y)
+
+    @pos.setter
+    def pos(self, value):
+        self.x, self.y = value
+
+    @property
+    def target(self):
+        return (self.tx, self.ty)
+
+    @target.setter
+    def target(self, value):
+        self.tx, self.ty = value
 
     def _random_point(self):
         """
         Pick a random point within the defined area.
         """
+        area = self.area
         return (
-            random.uniform(self.area["xmin"], self.area["xmax"]),
-            random.uniform(self.area["ymin"], self.area["ymax"]),
+            _uniform(area["xmin"], area["xmax"]),
+            _uniform(area["ymin"], area["ymax"]),
         )
 
     def next_position(self, dt_ms):
@@ -66,27 +95,25 @@ class RandomWaypoint:
             self.pause_time -= dt
             if self.pause_time <= 0:
                 # Choose new target and start moving
-                self.target = self._random_point()
-                self.speed = random.uniform(*self.speed_range)
+                self.tx, self.ty = tx, ty = self._random_point()
+                self.speed = speed = _uniform(*self.speed_range)
                 self.state = "move"
 
                 # Calculate unit velocity components toward target
-                dx = self.target[0] - self.pos[0]
-                dy = self.target[1] - self.pos[1]
-                dist = math.hypot(dx, dy) or 1.0  # avoid divide-by-zero
-                self.vel_x = self.speed * dx / dist
-                self.vel_y = self.speed * dy / dist
-
-        else:  # state == "move"
-            # Move toward target
-            self.pos = (
-                self.pos[0] + self.vel_x * dt,
-                self.pos[1] + self.vel_y * dt,
-            )
-
-            # Check if close enough to target to stop
-            if math.hypot(self.pos[0] - self.target[0], self.pos[1] - self.target[1]) < 1e-3:
-                self.state = "pause"
-                self.pause_time = random.uniform(*self.pause_range)
-
-        return self.pos
+                dx = tx - self.x
+                dy = ty - self.y
+                dist = hypot(dx, dy) or 1.0  # avoid divide-by-zero
+                self.vel_x = speed * dx / dist
+                self.vel_y = speed * dy / dist
+            return (self.x, self.y)
+
+        # state == "move": move toward target (read and write x/y once each)
+        self.x = x = self.x + self.vel_x * dt
+        self.y = y = self.y + self.vel_y * dt
+
+        # Check if close enough to target to stop
+        if hypot(x - self.tx, y - self.ty) < 1e-3:
+            self.state = "pause"
+            self.pause_time = _uniform(*self.pause_range)
+
+        return (x, y)
@@ -20,6 +20,19 @@ class BaseScheduler(ABC):
         
         Returns:
             list: List of (task, server) tuples representing assignments.
+
+        Note:
+            The simulator reuses Task objects from round to round (they are
+            reset and refilled, see WorkloadGenerator.task_pool). Do not keep
+            references to `tasks` after this call; copy the fields you need
+            (e.g. task.id, task.priority) if your scheduler remembers tasks.
+        """
+        pass
+
+    def on_run_end(self):
+        """
+        Optional hook: the simulator calls this once after the last round
+        (e.g. to save plots or a model). Does nothing by default.
         """
         pass
 
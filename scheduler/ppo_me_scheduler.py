@@ -5,18 +5,11 @@ import torch.optim as optim
 from scheduler.base_scheduler import BaseScheduler
 from matplotlib import pyplot as plt
 import numpy as np
-from config.metrics import (
-    calculate_transmission_cost,
-    calculate_processing_cost,
-    calculate_propagation_delay,
-    calculate_edge_energy,
-    calculate_regional_energy,
-    calculate_cloud_energy
-)
-from config.config import SERVER_CONFIG
+from config.metrics import calculate_propagation_delay, ENERGY_PER_KB
 
 def util_score(u: float) -> float:
-    
+    # Kept as a plain if/elif ladder: in CPython a bucket table lookup
+    # (int(u) // 10 -> tuple index) measured 2-3x slower than these compares.
     if u < 50.0:
         return 0.0
     elif u < 60.0:
@@ -46,27 +39,48 @@ class ActorCritic(nn.Module):
         features = self.shared(x)
         return self.policy_head(features), self.value_head(features)
 
+    def act_logits(self, x):
+        # action selection only needs the policy head (value head skipped)
+        return self.policy_head(self.shared(x))
+
 class PpoMEScheduler(BaseScheduler):
-    def __init__(self, buffer_threshold: int = 20, lr: float = 1e-3, hidden_dim: int = 64):
+    def __init__(self, buffer_threshold: int = 20, lr: float = 1e-3, hidden_dim: int = 64,
+                 plot_every: int = 20, minibatch_size: int = 64):
         super().__init__()
         self.buffer_threshold = buffer_threshold
+        # training plots are redrawn every plot_every updates and once more
+        # when the run ends (on_run_end); plot_every <= 0 = only at the end
+        self.plot_every = plot_every
+        self._plotted_updates = 0
         self.lr = lr
         self.hidden_dim = hidden_dim
         self.K_epochs = 4
+        # each epoch steps the optimizer once per shuffled minibatch of this
+        # size (None = one full-batch step per epoch)
+        self.minibatch_size = minibatch_size
         self.eps_clip = 0.2
         self.gamma = 0.99
 
         self.tier_names = ["Edge", "Regional", "Cloud"]
         self.training_mode = True
-        self.experience_buffer = []
+        # experience buffer as preallocated arrays (one row per step),
+        # allocated in _ensure_model once the state size is known
+        self.states_buf = None
+        self.actions_buf = None
+        self.rewards_buf = None
+        self.buf_idx = 0
         self.episode_rewards = []
         self.actor_losses = []
         self.critic_losses = []
         self.action_distribution_log = []
         self.model = None
         self.optimizer = None
+        self._tables_for = None  # servers_list the per-server tables were built for
+        self._servers_key = None  # ids of the servers servers_list was built from
         self.mse_loss = nn.MSELoss()
+        # Output paths are relative to the folder the simulator is run from
         self.model_path = "ppo_me_model.pth"
+        self.plot_dir = os.path.join("visualization", "train")
 
         # pointers for sequential fill
         self.edge_idx = 0
@@ -75,10 +89,7 @@ class PpoMEScheduler(BaseScheduler):
         self.phase = 0  # 0=edge,1=regional,2=cloud
 
     def _get_energy(self, task, server):
-        tier = server.name.split('_')[0]
-        if tier == "Edge": return calculate_edge_energy(task.data_size_kb)
-        if tier == "Regional": return calculate_regional_energy(task.data_size_kb)
-        return calculate_cloud_energy(task.data_size_kb)
+        return server.energy(task.data_size_kb)
 
     def _ensure_model(self):
         N = len(self.servers_list)
@@ -91,17 +102,54 @@ class PpoMEScheduler(BaseScheduler):
                     self.model.load_state_dict(torch.load(self.model_path))
                 except RuntimeError:
                     pass
+        if self._tables_for is not self.servers_list:
+            # per-server constants, looked up once instead of per (task, server)
+            self._tables_for = self.servers_list
+            self._prop_ms = [calculate_propagation_delay(sv.name) for sv in self.servers_list]
+            self._srv_cost = np.array([sv.cost for sv in self.servers_list])
+            self._srv_delay = np.array(self._prop_ms) / 1000.0
+            self._srv_energy = np.array([ENERGY_PER_KB[sv.tier] for sv in self.servers_list])
+        if self.states_buf is None or self.states_buf.shape[1] != input_dim:
+            cap = max(self.buffer_threshold, 1)
+            self.states_buf = np.empty((cap, input_dim), dtype=np.float32)
+            self.actions_buf = np.empty(cap, dtype=np.int64)
+            self.rewards_buf = np.empty(cap, dtype=np.float32)
+            self.buf_idx = 0
+
+    def _store(self, state, action, reward):
+        i = self.buf_idx
+        if i == len(self.actions_buf):
+            # one round can add more steps than buffer_threshold: double capacity
+            self.states_buf = np.concatenate([self.states_buf, np.empty_like(self.states_buf)])
+            self.actions_buf = np.concatenate([self.actions_buf, np.empty_like(self.actions_buf)])
+            self.rewards_buf = np.concatenate([self.rewards_buf, np.empty_like(self.rewards_buf)])
+        self.states_buf[i] = state
+        self.actions_buf[i] = action
+        self.rewards_buf[i] = reward
+        self.buf_idx = i + 1
 
-    def _construct_state(self, task):
-        state = []
-        for sv in self.servers_list:
+    # State of one task: per server (servers_list order) the six values
+    # [cpu, mem, cong, cost, delay, energy]; the first three come from
+    # _server_state(), the last three from _task_state().
+    def _server_state(self):
+        # live part of the state, one row per server: [cpu, mem, cong]
+        live = np.empty((len(self.servers_list), 3))
+        for k, sv in enumerate(self.servers_list):
             cpu, _, mem = sv.utilization()
-            cong = sv.congestion()
-            cost = calculate_processing_cost(task.cpu_demand, sv.cost) + calculate_transmission_cost(task.data_size_kb, sv.cost)
-            delay = calculate_propagation_delay(sv.name) / 1000.0
-            energy = self._get_energy(task, sv)
-            state.extend([cpu, mem, cong, cost, delay, energy])
-        return state
+            live[k] = (cpu, mem, sv.congestion())
+        return live
+
+    def _task_state(self, tasks):
+        # task-dependent part of the state for every (task, server) at once:
+        # cost = (cpu_demand + data_size_kb) * server cost, delay = propagation
+        # delay in s, energy = data_size_kb * per-KB energy rate
+        task_cpu = np.array([t.cpu_demand for t in tasks], dtype=np.float64)
+        task_data = np.array([t.data_size_kb for t in tasks], dtype=np.float64)
+        part = np.empty((len(tasks), len(self.servers_list), 3))
+        part[:, :, 0] = np.outer(task_cpu, self._srv_cost) + np.outer(task_data, self._srv_cost)
+        part[:, :, 1] = self._srv_delay
+        part[:, :, 2] = np.outer(task_data, self._srv_energy)
+        return part
 
     def _compute_reward(self, delay, cost, congestion, cpu_util, mem_util, energy, server_idx):
         if delay < 0.005: D_r = 10
@@ -117,82 +165,116 @@ class PpoMEScheduler(BaseScheduler):
         over_cpu = max(0.0, cpu_util - 70.0)
         over_mem = max(0.0, mem_util - 70.0)
         over_penalty = -50.0 * (over_cpu + over_mem)
-        edge_count = SERVER_CONFIG['Edge']['num_datacenters']
-        reg_count  = SERVER_CONFIG['Regional']['num_datacenters']
-        if server_idx < edge_count: tier_bias = 5.0
-        elif server_idx < edge_count + reg_count: tier_bias = 1.0
-        else: tier_bias = 0.0
+        tier_bias = (5.0, 1.0, 0.0)[self.servers_list[server_idx].tier_idx]
         base = 0.2*D_r + 0.2*C_r + 0.15*Con_r + 0.15*E_r + 0.15*cpu_r + 0.15*mem_r
         return base + over_penalty + tier_bias
 
     def train_ppo(self):
-        states, actions, rewards = zip(*self.experience_buffer)
-        states  = torch.FloatTensor(states)
-        actions = torch.LongTensor(actions).view(-1)
-        rewards = torch.FloatTensor(rewards).view(-1)
+        n = self.buf_idx
+        states  = torch.from_numpy(self.states_buf[:n])  # views, no copy
+        actions = torch.from_numpy(self.actions_buf[:n])
+        rewards = torch.from_numpy(self.rewards_buf[:n])
+        mb = self.minibatch_size or n
         for _ in range(self.K_epochs):
-            logits, values = self.model(states)
-            dist = torch.distributions.Categorical(logits=logits)
-            log_probs = dist.log_prob(actions)
-            advantages = rewards - values.squeeze().detach()
-            actor_loss  = -(log_probs * advantages).mean()
-            critic_loss = self.mse_loss(values.squeeze(), rewards)
-            loss        = actor_loss + critic_loss
-            self.optimizer.zero_grad()
-            loss.backward()
-            self.optimizer.step()
+            order = torch.randperm(n) if mb < n else None
+            actor_sum = critic_sum = 0.0
+            probs_sum = 0.0
+            for start in range(0, n, mb):
+                if order is None:
+                    s_b, a_b, r_b = states, actions, rewards
+                else:
+                    idx = order[start:start+mb]
+                    s_b, a_b, r_b = states[idx], actions[idx], rewards[idx]
+                logits, values = self.model(s_b)
+                values = values.squeeze(-1)
+                dist = torch.distributions.Categorical(logits=logits)
+                log_probs = dist.log_prob(a_b)
+                advantages = r_b - values.detach()
+                actor_loss  = -(log_probs * advantages).mean()
+                critic_loss = self.mse_loss(values, r_b)
+                loss        = actor_loss + critic_loss
+                self.optimizer.zero_grad(set_to_none=True)
+                loss.backward()
+                self.optimizer.step()
+                # running (sample-weighted) sums over this epoch, for logging
+                k = len(a_b)
+                actor_sum += actor_loss.item() * k
+                critic_sum += critic_loss.item() * k
+                probs_sum = probs_sum + dist.probs.detach().sum(dim=0)
 
         avg_reward = rewards.mean().item()
         self.episode_rewards.append(avg_reward)
-        self.actor_losses.append(actor_loss.item())
-        self.critic_losses.append(critic_loss.item())
+        self.actor_losses.append(actor_sum / n)    # mean over the last epoch
+        self.critic_losses.append(critic_sum / n)
 
-        # compute mean action probs across batch
-        probs = dist.probs.mean(dim=0).detach().cpu().numpy()
+        # compute mean action probs across batch (last epoch)
+        probs = (probs_sum / n).cpu().numpy()
         probs /= probs.sum()
-        tier_map = []
-        for sv in self.servers_list:
-            t = sv.name.split('_')[0]
-            tier_map.append({"Edge":0, "Regional":1}.get(t, 2))
+        tier_map = [sv.tier_idx for sv in self.servers_list]
         ad = [0.0, 0.0, 0.0]
         for idx, p in enumerate(probs):
             ad[tier_map[idx]] += p
         self.action_distribution_log.append(ad)
 
-        self.experience_buffer.clear()
+        self.buf_idx = 0
         torch.save(self.model.state_dict(), self.model_path)
 
-        # plot & save
+        if self.plot_every > 0 and len(self.episode_rewards) % self.plot_every == 0:
+            self.save_plots()
+
+    def on_run_end(self):
+        # called by the simulator after the last round: final training plots
+        self.save_plots()
+
+    def save_plots(self):
+        # plot & save (curves cover every update so far)
+        if len(self.episode_rewards) == self._plotted_updates:
+            return
+        self._plotted_updates = len(self.episode_rewards)
+        os.makedirs(self.plot_dir, exist_ok=True)
         plt.figure()
         plt.plot(self.episode_rewards)
         plt.xlabel('Episodes'); plt.ylabel('Average Reward')
         plt.title('Average Reward per Episode'); plt.grid()
-        plt.savefig('visualization/train/average_reward.png'); plt.close()
+        plt.savefig(os.path.join(self.plot_dir, 'average_reward.png')); plt.close()
         plt.figure()
         plt.plot(self.actor_losses,  label='Actor Loss')
         plt.plot(self.critic_losses, label='Critic Loss')
         plt.xlabel('Episodes'); plt.ylabel('Loss')
         plt.title('Loss Convergence'); plt.legend(); plt.grid()
-        plt.savefig('visualization/train/loss_convergence.png'); plt.close()
+        plt.savefig(os.path.join(self.plot_dir, 'loss_convergence.png')); plt.close()
         arr = np.array(self.action_distribution_log)
         plt.figure()
         plt.stackplot(range(len(arr)), arr.T, labels=['Edge','Regional','Cloud'])
         plt.xlabel('Episodes'); plt.ylabel('Action Ratio')
         plt.title('Action Distribution Over Time'); plt.legend(); plt.grid()
-        plt.savefig('visualization/train/action_distribution.png'); plt.close()
+        plt.savefig(os.path.join(self.plot_dir, 'action_distribution.png')); plt.close()
 
     def schedule(self, tasks, servers, current_time):
-        self.servers_list = []
-        for tier in self.tier_names:
-            ts = [s for s in servers if s.name.startswith(tier)]
-            ts.sort(key=lambda s: int(s.name.split('_')[1]))
-            self.servers_list.extend(ts)
+        # servers_list: Edge, Regional, Cloud order (tier_idx), then by number
+        # within the tier. Rebuilt only when the server set changes.
+        key = tuple(map(id, servers))
+        if key != self._servers_key:
+            self._servers_key = key
+            self.servers_list = sorted(
+                (s for s in servers if s.tier in self.tier_names),
+                key=lambda s: (s.tier_idx, s.index),
+            )
+            self._edge_count = sum(s.tier_idx == 0 for s in self.servers_list)
+            self._reg_count  = sum(s.tier_idx == 1 for s in self.servers_list)
         self._ensure_model()
-        edge_count = sum(s.name.startswith('Edge')    for s in self.servers_list)
-        reg_count  = sum(s.name.startswith('Regional')for s in self.servers_list)
+        edge_count = self._edge_count
+        reg_count  = self._reg_count
         cloud_count = len(self.servers_list) - edge_count - reg_count
         assignments=[]; TH=70.0
-        for task in tasks:
+        # server-side state is read once here and then only refreshed for the
+        # server that takes a task; task-side columns are built for all tasks
+        live = self._server_state()
+        task_part = self._task_state(tasks)
+        state = np.empty((len(self.servers_list), 6), dtype=np.float32)  # model input dtype
+        state_t = torch.from_numpy(state.reshape(1, -1))  # shares memory with state
+        masks = {}  # allowed servers -> -inf/0 logit mask, built once per call
+        for t, task in enumerate(tasks):
             if self.phase==0:
                 if self.edge_idx<edge_count:
                     if self.servers_list[self.edge_idx].utilization()[0]>=TH: self.edge_idx+=1
@@ -211,12 +293,20 @@ class PpoMEScheduler(BaseScheduler):
                 if self.phase==0: allowed=list(range(edge_count))
                 elif self.phase==1: allowed=list(range(edge_count,edge_count+reg_count))
                 else: allowed=list(range(edge_count+reg_count,len(self.servers_list)))
-            state=self._construct_state(task)
-            logits,_=self.model(torch.FloatTensor([state])); logits=logits[0]
-            mask=torch.full_like(logits,float('-inf'))
-            for i in allowed: mask[i]=0.0
-            dist=torch.distributions.Categorical(logits=logits+mask)
-            action=dist.sample().item()
+            state[:, :3] = live; state[:, 3:] = task_part[t]  # [cpu, mem, cong, cost, delay, energy] per server
+            if len(allowed)==1:
+                # a mask with one allowed server always samples that server,
+                # so the policy forward pass is skipped
+                action=allowed[0]
+            else:
+                mask=masks.get(tuple(allowed))
+                if mask is None:
+                    mask=masks[tuple(allowed)]=torch.full((len(self.servers_list),),float('-inf'))
+                    mask[allowed]=0.0
+                with torch.no_grad():
+                    logits=self.model.act_logits(state_t)
+                dist=torch.distributions.Categorical(logits=logits[0]+mask)
+                action=dist.sample().item()
             if self.phase==2 and action>=edge_count+reg_count: self.cloud_idx+=1
             srv=self.servers_list[action]
             if srv.can_allocate(task.cpu_demand,task.storage_demand,task.memory_demand):
@@ -224,12 +314,13 @@ class PpoMEScheduler(BaseScheduler):
                 task.set_server(srv.name); assignments.append((task,srv))
                 cpu,_,mem=srv.utilization(); energy=self._get_energy(task,srv)
                 reward=self._compute_reward(
-                    delay=calculate_propagation_delay(srv.name),
-                    cost=(calculate_processing_cost(task.cpu_demand,srv.cost)+calculate_transmission_cost(task.data_size_kb,srv.cost)),
+                    delay=self._prop_ms[action],
+                    cost=task.cpu_demand*srv.cost+task.data_size_kb*srv.cost,
                     congestion=srv.congestion(), cpu_util=cpu, mem_util=mem, energy=energy, server_idx=action)
-                self.experience_buffer.append((state,action,reward))
+                self._store(state.reshape(-1),action,reward)
+                live[action] = (cpu, mem, srv.congestion())
             else:
                 task.fail()
-        if self.training_mode and len(self.experience_buffer)>=self.buffer_threshold:
+        if self.training_mode and self.buf_idx>=self.buffer_threshold:
             self.train_ppo()
         return assignments
@@ -1,55 +1,73 @@
+import heapq
+import logging
+
 from scheduler.base_scheduler import BaseScheduler
 
+logger = logging.getLogger(__name__)
+
+
+def _free(s):
+    # Sort key: total free resources (smallest = most loaded server first)
+    return s.available_cpu + s.available_memory + s.available_storage
+
+
+def _tier_heap(servers, tier):
+    # Heap of (free resources, position, server) for one tier. The position
+    # breaks ties in server order, like min() over the tier list.
+    heap = [(_free(s), i, s) for i, s in enumerate(s for s in servers if s.tier == tier)]
+    heapq.heapify(heap)
+    return heap
+
+
+def _take(heap, task):
+    """
+    Pop the most loaded server that can fit `task` (None if none can).
+    Servers that cannot fit it go back on the heap for later tasks.
+    """
+    skipped = []
+    selected = None
+    while heap:
+        entry = heapq.heappop(heap)
+        if entry[2].can_allocate(task.cpu_demand, task.storage_demand, task.memory_demand):
+            selected = entry
+            break
+        skipped.append(entry)
+    for entry in skipped:
+        heapq.heappush(heap, entry)
+    return selected
+
+
 class RuleBasedScheduler(BaseScheduler):
     def schedule(self, tasks, servers, current_time):
         results = []
+        unassigned = 0
+
+        # Split servers by tier once; each tier is a heap on free resources,
+        # so picking the most loaded server is a pop instead of a full scan.
+        tiers = [_tier_heap(servers, tier) for tier in ("Edge", "Regional", "Cloud")]
 
         for task in tasks:
-            assigned = False
             server = None
 
-            # --- Check Edge servers ---
-            eligible_edge = [
-                s for s in servers
-                if s.name.startswith("Edge") and s.can_allocate(task.cpu_demand, task.storage_demand, task.memory_demand)
-            ]
-            if eligible_edge:
-                selected = min(eligible_edge, key=lambda s: s.available_cpu + s.available_memory + s.available_storage)
-                release_time = current_time + selected.latency
-                selected.allocate(task.id, task.cpu_demand, task.storage_demand, task.memory_demand, release_time)
-                server = selected
-                assigned = True
-
-            # --- Check Regional if not assigned ---
-            if not assigned:
-                eligible_regional = [
-                    s for s in servers
-                    if s.name.startswith("Regional") and s.can_allocate(task.cpu_demand, task.storage_demand, task.memory_demand)
-                ]
-                if eligible_regional:
-                    selected = min(eligible_regional, key=lambda s: s.available_cpu + s.available_memory + s.available_storage)
-                    release_time = current_time + selected.latency
-                    selected.allocate(task.id, task.cpu_demand, task.storage_demand, task.memory_demand, release_time)
-                    server = selected
-                    assigned = True
-
-            # --- Check Cloud if not assigned ---
-            if not assigned:
-                eligible_cloud = [
-                    s for s in servers
-                    if s.name.startswith("Cloud") and s.can_allocate(task.cpu_demand, task.storage_demand, task.memory_demand)
-                ]
-                if eligible_cloud:
-                    selected = min(eligible_cloud, key=lambda s: s.available_cpu + s.available_memory + s.available_storage)
+            # --- Check Edge, then Regional, then Cloud ---
+            for heap in tiers:
+                entry = _take(heap, task)
+                if entry is not None:
+                    _, i, selected = entry
                     release_time = current_time + selected.latency
                     selected.allocate(task.id, task.cpu_demand, task.storage_demand, task.memory_demand, release_time)
+                    # Its free resources changed: push it back with the new key
+                    heapq.heappush(heap, (_free(selected), i, selected))
                     server = selected
-                    assigned = True
+                    break
 
-            # Log unassigned task
-            if not assigned:
-                print(f"❌ Task {task.id} could not be assigned due to resource constraints.")
+            # Count unassigned tasks (one summary line per call, below)
+            if server is None:
+                unassigned += 1
 
             results.append((task, server))
 
+        if unassigned:
+            logger.warning("❌ %d task(s) could not be assigned due to resource constraints (t=%s).",
+                           unassigned, current_time)
         return results
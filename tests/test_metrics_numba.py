@@ -0,0 +1,14 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from config.metrics_numba import aggregate
+
+
+def test_unassigned_rows_are_skipped():
+    # Row 1 is unassigned (-1): it must not be counted as Cloud (index 2).
+    with_unassigned = aggregate([10.0, 99.0, 10.0], [0, -1, 2], [10.0, 99.0, 10.0])
+    assigned_only = aggregate([10.0, 10.0], [0, 2], [10.0, 10.0])
+    for got, want in zip(with_unassigned, assigned_only):
+        np.testing.assert_allclose(got, want)
+    assert with_unassigned[5].tolist() == [1.0, 0.0, 1.0]
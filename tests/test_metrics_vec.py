@@ -0,0 +1,27 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from config import metrics as M
+from config import metrics_vec as V
+
+
+def test_batch_helpers_match_scalar_helpers():
+    kb = [10.0, 20.0, 30.0]
+    idx = V.layer_index(["Edge_1", "Regional_1", "Cloud_1"])
+    names = ["Edge_1", "Regional_1", "Cloud_1"]
+    want = [M.calculate_total_delay(k, n) for k, n in zip(kb, names)]
+    np.testing.assert_allclose(V.batch_total_delay(kb, idx), want)
+
+
+def test_unassigned_rows_give_zero():
+    # -1 (unassigned) must not read the Cloud row of the tier tables.
+    kb = [10.0, 10.0]
+    idx = np.array([2, -1])
+    for fn in (V.batch_transmission_delay, V.batch_transmission_cost,
+               V.batch_processing_cost, V.batch_energy):
+        got = fn(kb, idx)
+        assert got[0] > 0.0 and got[1] == 0.0
+    assert V.batch_propagation_delay(idx).tolist()[1] == 0.0
+    assert V.batch_total_cost(kb, kb, idx)[1] == 0.0
+    assert V.batch_propagation_delay(-1) == 0.0
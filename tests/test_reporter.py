@@ -0,0 +1,59 @@
+import csv
+import importlib
+
+import pytest
+
+FIELDS = [
+    ("round_no", "Round", "{}"),
+    ("workload", "Workload", "{:.2f}"),
+    ("layer", "Paradigm", "{}"),
+    ("end", "End", "{:.2f}"),
+]
+
+
+@pytest.fixture
+def reporter(tmp_path, monkeypatch):
+    # Importing core.reporter opens results/task_metrics_log.csv in the
+    # current folder, so import it from a scratch folder.
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("core.reporter")
+
+
+def test_binary_sink_handles_changed_types_and_none(reporter, tmp_path):
+    rep = reporter.Reporter(FIELDS, str(tmp_path / "out.csv"), log_console=False,
+                            binary_sink=str(tmp_path / "out.bin"),
+                            binary_types={"layer": "32s"})
+    rep.report_many([
+        {"round_no": 1, "workload": 1000, "layer": "Edge_1", "end": 2.5},
+        # int field given as an integral float, float field given as an int,
+        # a long label, and a missing (None) value
+        {"round_no": 2.0, "workload": 1100.5, "layer": "Regional_12345678901234", "end": None},
+    ])
+    rep.close()
+
+    reporter.bin_to_csv(str(tmp_path / "out.bin"), str(tmp_path / "back.csv"))
+    with open(tmp_path / "back.csv", newline="") as fh:
+        rows = list(csv.reader(fh))
+    assert rows == [
+        ["Round", "Workload", "Paradigm", "End"],
+        ["1", "1000.0", "Edge_1", "2.5"],
+        ["2", "1100.5", "Regional_12345678901234", ""],
+    ]
+
+
+def test_binary_sink_rejects_text_longer_than_its_column(reporter, tmp_path):
+    rep = reporter.Reporter(FIELDS, str(tmp_path / "out.csv"), log_console=False,
+                            binary_sink=str(tmp_path / "out.bin"),
+                            binary_types={"layer": "8s"})
+    with pytest.raises(ValueError, match="Paradigm"):
+        rep.report({"round_no": 1, "workload": 1, "layer": "Regional_1", "end": 0.0})
+    rep.close()
+
+
+def test_binary_sink_rejects_fractional_int(reporter, tmp_path):
+    rep = reporter.Reporter(FIELDS, str(tmp_path / "out.csv"), log_console=False,
+                            binary_sink=str(tmp_path / "out.bin"),
+                            binary_types={"layer": "32s"})
+    with pytest.raises(ValueError, match="Round"):
+        rep.report({"round_no": 1.5, "workload": 1, "layer": "Edge_1", "end": 0.0})
+    rep.close()
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from config.config import MOBILITY_CONFIG
+from mobility import _kernels
+from mobility.manager import MobilityManager
+from mobility.mobile_entity import MobileEntity
+from mobility.mobility_vec import WaypointFleet
+from mobility.random_waypoint import RandomWaypoint
+
+AREA = dict(xmin=0.0, xmax=1000.0, ymin=0.0, ymax=1000.0)
+FIELDS = ("x", "y", "tx", "ty", "vel_x", "vel_y", "pause_time", "state", "speed")
+
+
+def _models(n=200, seed=5):
+    random.seed(seed)
+    return [RandomWaypoint(AREA, (1.0, 5.0), (0.0, 0.5)) for _ in range(n)]
+
+
+@pytest.mark.parametrize("kernels", [None, _kernels if _kernels.HAVE_NUMBA else None])
+def test_sync_matches_scalar_models(kernels):
+    ref = _models()
+    for _ in range(40):
+        for m in ref:
+            m.next_position(100)
+
+    models = _models()
+    fleet = WaypointFleet(models, kernels)
+    for _ in range(40):
+        xy = fleet.advance_all(100)
+    fleet.sync()
+
+    assert xy.tolist() == [[m.x, m.y] for m in ref]
+    for got, want in zip(models, ref):
+        for name in FIELDS:
+            assert getattr(got, name) == getattr(want, name), name
+
+
+def test_vectorized_manager_rejects_1d_devices(monkeypatch):
+    monkeypatch.setitem(MOBILITY_CONFIG, "vectorized", True)
+
+    class _Srv:
+        x, y, location, mobility = 0.0, 0.0, 0.0, None
+
+    devices = [MobileEntity(0, [1.0, 2.0], 1.0), MobileEntity(1, 5.0, 1.0)]
+    with pytest.raises(ValueError, match="2D"):
+        MobilityManager([_Srv()], devices)
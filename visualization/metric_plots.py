@@ -0,0 +1,87 @@
+"""
+Shared renderer for the per-layer metric plots (plotter.py, plotter_bar.py,
+vbd_plotter.py). Each of those scripts only chooses the x column, the plot
+kind and its labels/filenames.
+"""
+import os
+import argparse
+import pandas as pd
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+LAYER_ORDER = ['Edge', 'Regional', 'Cloud']
+
+# (csv path, file mtime, x column, metrics) -> grouped DataFrame, so scripts
+# run in the same process read and group the same log only once
+_grouped_cache = {}
+
+
+def load_grouped(csv_path, x_col, metrics):
+    """
+    Mean of every metric per (x_col, 'Executed on'), from one CSV read.
+    """
+    key = (os.path.abspath(csv_path), os.path.getmtime(csv_path), x_col, tuple(metrics))
+    grouped = _grouped_cache.get(key)
+    if grouped is None:
+        # Read only the needed columns; 'Executed on' has 3 distinct strings,
+        # so a category dtype stores small codes instead of strings.
+        # (x_col stays numeric: as a category it would sort '10' < '100' < '20'.)
+        df = pd.read_csv(csv_path, usecols=[x_col, 'Executed on', *metrics],
+                         dtype={'Executed on': 'category'})
+        # One groupby for every metric (instead of one per plot)
+        grouped = df.groupby([x_col, 'Executed on'], observed=True)[list(metrics)].mean().reset_index()
+        _grouped_cache[key] = grouped
+    return grouped
+
+
+def plot_metric(data, x_col, y_col, y_label, path, kind='line', x_label=None, figsize=(10, 5)):
+    """
+    One metric, one hue per layer: kind='bar' (grouped bars) or 'line'.
+    """
+    plt.figure(figsize=figsize)
+    if kind == 'bar':
+        ax = sns.barplot(data=data, x=x_col, y=y_col, hue="Executed on",
+                         hue_order=LAYER_ORDER, dodge=True)
+    else:
+        ax = sns.lineplot(data=data, x=x_col, y=y_col, hue='Executed on',
+                          hue_order=LAYER_ORDER, marker='o', linewidth=2.0)
+    ax.set_xlabel(x_label or x_col)
+    ax.set_ylabel(y_label)
+    ax.legend(title=None, loc='upper left')
+    plt.xticks(rotation=45)
+    sns.despine()
+    plt.tight_layout()
+    plt.savefig(path, dpi=300)
+    plt.close()
+
+
+def generate_plots(csv_path, output_dir, plot_info, x_col, x_label, kind='line', figsize=(10, 5)):
+    """
+    plot_info: column -> (y-axis label, output filename)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    sns.set_context("paper", font_scale=1.5)
+    sns.set_style("white")  # Clean IEEE style
+
+    grouped = load_grouped(csv_path, x_col, list(plot_info))
+    for col, (y_label, filename) in plot_info.items():
+        plot_metric(grouped, x_col, col, y_label, os.path.join(output_dir, filename),
+                    kind=kind, x_label=x_label, figsize=figsize)
+
+
+def main(generate, description):
+    """
+    Command-line entry point shared by the plot scripts.
+    """
+    try:
+        parser = argparse.ArgumentParser(description=description)
+        parser.add_argument("--csv", required=False, default="results/task_metrics_log.csv",
+                            help="Path to CSV file (default: results/task_metrics_log.csv)")
+        parser.add_argument("--out", default="visualization", help="Folder to save plots (default: visualization)")
+        args = parser.parse_args()
+        generate(args.csv, args.out)
+    except SystemExit as e:
+        if e.code == 2:
+            print("❌ Error: Please provide the required --csv argument.\nExample:\n  python plotter.py --csv results/task_metrics_log.csv")
+        raise
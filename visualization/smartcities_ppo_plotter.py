@@ -31,18 +31,19 @@ def generate_priority_plots(csv_file='results/task_metrics_log.csv', output_dir=
     # Output directory
     os.makedirs(output_dir, exist_ok=True)
 
-    for metric, ylabel in metrics:
-        for priority in priorities:
-            subset = data[data['Flag'] == priority]
-            workloads = sorted(subset['Workload'].unique())
-            n = len(workloads)
+    for priority in priorities:
+        # Filter once per priority and keep the first row of each
+        # (Workload, layer) cell; every metric below reads from this table.
+        subset = data[data['Flag'] == priority]
+        workloads = sorted(subset['Workload'].unique())
+        n = len(workloads)
+        firsts = subset.drop_duplicates(['Workload', 'Executed on']).set_index(['Workload', 'Executed on'])
 
-            result = np.full((n, len(layers)), np.nan)
-            for i, wl in enumerate(workloads):
-                for j, layer in enumerate(layers):
-                    val = subset[(subset['Workload'] == wl) & (subset['Executed on'] == layer)][metric]
-                    if not val.empty:
-                        result[i, j] = val.values[0]
+        for metric, ylabel in metrics:
+            # (workloads x layers) grid in one pivot; missing cells are NaN
+            result = (firsts[metric].unstack()
+                      .reindex(index=workloads, columns=layers)
+                      .to_numpy(dtype=float))
 
             # Create figure
             fig, ax = plt.subplots(figsize=(4, 4))
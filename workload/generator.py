@@ -13,7 +13,7 @@ Notes:
 """
 
 import random
-from entities.task import Task
+from core.task_batch import TaskBatch
 from config.config import WORKLOAD
 
 
@@ -22,7 +22,8 @@ class WorkloadGenerator:
     Produces synthetic workload (tasks) to simulate IoT devices generating data.
 
     Students:
-    - To change how tasks are generated, modify generate_tasks().
+    - To change how tasks are generated, modify generate_batch(); the
+      simulator and generate_tasks() (list-of-Task version) both build on it.
     - You can change demand values (CPU, storage, etc.) to simulate different
       application types or device capabilities.
     """
@@ -34,44 +35,55 @@ class WorkloadGenerator:
         self.increment = WORKLOAD["increment"]
         self.data_per_device_kb = WORKLOAD["data_per_device_kb"]
 
-    def generate_tasks(self, round_no):
-        """
-        Generate tasks for the current round.
+        # Task objects reused from round to round (grows up to max_devices):
+        # a round's tasks are only valid until the next round is generated.
+        self.task_pool = []
 
+    def _device_count(self, round_no):
+        """
         Device count grows by 'increment' each round until max_devices.
-        Each task gets identical CPU, storage, and memory demands
-        (students can randomize or differentiate if needed).
         """
-        tasks = []
-
-        # Determine number of devices for this round
         current_devices = self.start_devices + ((round_no - 1) * self.increment)
         if current_devices > self.max_devices:
             current_devices = self.max_devices
+        return current_devices
 
-        for device_id in range(current_devices):
-            cpu_demand = self.data_per_device_kb
-            storage_demand = self.data_per_device_kb
-            memory_demand = self.data_per_device_kb
-            bandwidth = self.data_per_device_kb
+    @staticmethod
+    def _draw_priorities(n):
+        """
+        Random priority per device (1 = high, 3 = low), drawn in one
+        random.choices() call instead of n random.choice() calls.
+        """
+        return random.choices((1, 2, 3), k=n)
 
-            # Assign a random priority (1 = high, 3 = low)
-            priority = random.choice([1, 2, 3])
+    def generate_tasks(self, round_no):
+        """
+        Generate tasks for the current round.
 
-            task = Task(
-                cpu_demand=cpu_demand,
-                storage_demand=storage_demand,
-                memory_demand=memory_demand,
-                bandwidth=bandwidth,
-                latency=None,  # can be set by scheduler if needed
-                priority=priority
-            )
-            tasks.append(task)
+        Device count grows by 'increment' each round until max_devices.
+        Each task gets identical CPU, storage, and memory demands
+        (students can randomize or differentiate if needed).
+        The Task objects come from task_pool, so they are only valid until
+        the next round is generated.
+        """
+        return self.generate_batch(round_no).to_tasks(self.task_pool)
+
+    def generate_batch(self, round_no):
+        """
+        This round's workload as a TaskBatch (columns). The simulator and
+        generate_tasks() make the scheduler's Task objects from it.
+        """
+        current_devices = self._device_count(round_no)
 
-        return tasks
+        return TaskBatch.uniform(
+            current_devices,
+            demand=self.data_per_device_kb,
+            data_kb=self.data_per_device_kb,
+            priorities=self._draw_priorities(current_devices),
+        )
 
     def reset(self):
         """
-        Retained for compatibility (no internal state to reset here).
+        Drop the pooled Task objects (the next round creates new ones).
         """
-        pass
+        self.task_pool.clear()